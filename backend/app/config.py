@@ -11,7 +11,8 @@ Business Rationale:
 - Separating config from code follows 12-factor app principles
 """
 
-from pydantic_settings import BaseSettings
+from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
@@ -26,6 +27,10 @@ class Settings(BaseSettings):
     # Database Configuration
     # Using async PostgreSQL driver for non-blocking I/O
     DATABASE_URL: str = "postgresql+asyncpg://postgres:postgres@db:5432/primetrade"
+    # Connection pool per worker process (PostgreSQL only). Total
+    # connections can reach WEB_CONCURRENCY * (DB_POOL_SIZE + DB_MAX_OVERFLOW).
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
     
     # JWT Authentication Settings
     # These control session duration and token security
@@ -33,14 +38,44 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     
+    # Password Hashing
+    # bcrypt work factor (log2 rounds): each +1 doubles hashing time.
+    # Existing hashes with a different cost are upgraded on next login.
+    BCRYPT_COST: int = Field(default=12, ge=4, le=31)
+    
+    # Authentication caches
+    # How long a resolved user stays cached before the DB is consulted again.
+    # Bounds how stale role changes or deleted accounts can be.
+    USER_CACHE_TTL_SECONDS: int = 60
+    # How long a verified token's claims are reused without re-checking the
+    # signature. Entries never outlive the token's own exp claim.
+    TOKEN_CACHE_TTL_SECONDS: int = 60
+    # How long a successful password check is remembered, so repeat logins
+    # with the same credentials skip bcrypt. Set to 0 to always run bcrypt.
+    PASSWORD_VERIFY_CACHE_TTL_SECONDS: int = 60
+    
+    # Portfolio summary cache
+    # How long a user's summary is reused. Their own trade changes evict it
+    # immediately; this only bounds staleness across worker processes.
+    PORTFOLIO_CACHE_TTL_SECONDS: int = 30
+    
     # Application Settings
     APP_NAME: str = "Crypto Trade Logger"
     DEBUG: bool = False
     
-    class Config:
-        # Load from .env file if present
-        env_file = ".env"
-        env_file_encoding = "utf-8"
+    # CORS
+    # Exact browser origins allowed to call the API (JSON list in env vars,
+    # e.g. CORS_ORIGINS='["https://app.example.com"]')
+    CORS_ORIGINS: list[str] = ["http://localhost:5173", "http://localhost:3000"]
+    
+    # Schema Management
+    # Run create_all on startup. Convenient for local/Docker setups; turn it
+    # off for production replicas so a rolling deploy doesn't have every
+    # worker probing the catalog at once, and manage the schema separately.
+    CREATE_TABLES_ON_STARTUP: bool = True
+    
+    # Load from .env file if present
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
 
 @lru_cache()
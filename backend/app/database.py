@@ -10,12 +10,16 @@ Why Async SQLAlchemy?
 
 Technical Notes:
 - Using asyncpg driver (fastest PostgreSQL driver for Python)
-- Session management via async context managers for automatic cleanup
+- Sessions are created lazily per request and closed by DBSessionMiddleware
 - Base class provides common functionality for all models
 """
 
+from fastapi import Request
+from sqlalchemy import DateTime
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.sql.expression import FunctionElement
 from app.config import get_settings
 
 settings = get_settings()
@@ -32,14 +36,35 @@ if settings.DATABASE_URL.startswith("sqlite"):
     )
 else:
     # PostgreSQL configuration for production
+    # echo is always off here: SQL echo formats and logs every statement
     # pool_pre_ping: Verifies connections are alive before using them
     # This prevents "connection closed" errors in long-running applications
     engine = create_async_engine(
         settings.DATABASE_URL,
-        echo=settings.DEBUG,
+        echo=False,
         pool_pre_ping=True,
-        pool_size=10,  # Maintain up to 10 connections
-        max_overflow=20,  # Allow 20 additional connections under load
+        pool_size=settings.DB_POOL_SIZE,  # Connections kept open (default 10)
+        max_overflow=settings.DB_MAX_OVERFLOW,  # Extra under load (default 20)
+        # Replace connections older than 30 minutes so idle ones don't go
+        # stale behind proxies/firewalls (SQLAlchemy's equivalent of
+        # asyncpg's max_inactive_connection_lifetime)
+        pool_recycle=1800,
+        connect_args={
+            # Per-connection LRU of prepared statements kept by SQLAlchemy's
+            # asyncpg adapter: repeat queries skip the server parse/plan step
+            "prepared_statement_cache_size": 256,
+            # asyncpg's own statement cache, used for queries it prepares itself
+            "statement_cache_size": 1024,
+            # Fail a hung query after 30s instead of holding the connection
+            "command_timeout": 30,
+            "server_settings": {
+                # JIT compilation only pays off for long analytical queries;
+                # for short OLTP lookups its startup cost dominates
+                "jit": "off",
+                # Identifies our sessions in pg_stat_activity
+                "application_name": "primetrade",
+            },
+        },
     )
 
 # Session factory for creating database sessions
@@ -65,30 +90,57 @@ class Base(DeclarativeBase):
     pass
 
 
-async def get_db() -> AsyncSession:
+class utcnow(FunctionElement):
+    """
+    Current UTC timestamp, evaluated by the database.
+    
+    Timestamp columns store naive UTC (matching datetime.utcnow), but
+    PostgreSQL's now() is in the server's timezone, so this renders as
+    TIMEZONE('utc', CURRENT_TIMESTAMP) there. SQLite's CURRENT_TIMESTAMP
+    is already UTC.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _compile_utcnow(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "postgresql")
+def _compile_utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+async def get_db(request: Request) -> AsyncSession:
     """
-    Dependency that provides a database session.
+    Dependency that provides the request's database session.
     
     Usage in FastAPI:
         async def endpoint(db: AsyncSession = Depends(get_db)):
             ...
     
-    The session is automatically closed after the request completes,
-    ensuring we don't leak database connections.
+    The session is created on first use and cached on request.state, so
+    every dependency in a request shares it. DBSessionMiddleware closes it
+    after the response is sent, which lets this be a plain coroutine rather
+    than a generator: FastAPI skips the per-request exit-stack setup and
+    teardown it needs for yield dependencies. It stays async so FastAPI
+    doesn't dispatch it to the threadpool.
     """
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
+    session = getattr(request.state, "db", None)
+    if session is None:
+        session = AsyncSessionLocal()
+        request.state.db = session
+    return session
 
 
 async def create_tables():
     """
     Create all database tables.
     
-    Called on application startup to ensure schema exists.
-    In production, consider using Alembic for migrations instead.
+    Called on application startup when CREATE_TABLES_ON_STARTUP is set.
+    In production, disable that and manage the schema with migrations.
     """
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
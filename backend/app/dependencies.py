@@ -12,41 +12,65 @@ What is Dependency Injection?
 Security Implementation:
 - The get_current_user dependency extracts and validates JWT token
 - The get_current_admin_user dependency checks for admin privileges
+  using the token's claims alone (no database lookup)
 - All protected routes simply declare this dependency
 - Centralized auth logic = single point to update if needed
+
+Performance:
+- Resolved users are cached by ID for a short TTL, so repeat
+  requests from the same user skip the user lookup query entirely
+- The cache holds frozen UserResponse snapshots, not ORM instances:
+  a User belongs to the session that loaded it, and sharing it across
+  requests would let one request's session expire or lazy-load an
+  object another request is reading
 """
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from app.config import get_settings
 from app.database import get_db
 from app.models.user import User
+from app.schemas.user import UserResponse
 from app.services.auth_service import AuthService
 
+settings = get_settings()
+
 # OAuth2 scheme that looks for token in Authorization: Bearer <token> header
 # tokenUrl points to the login endpoint for OpenAPI docs integration
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Authenticated users keyed by user ID, as immutable UserResponse snapshots
+# Only consulted after the token itself has been verified.
+# Bounded size with TTL expiry keeps memory flat and limits staleness.
+_user_cache: TTLCache = TTLCache(
+    maxsize=10_000,
+    ttl=settings.USER_CACHE_TTL_SECONDS
+)
+
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
-) -> User:
+) -> UserResponse:
     """
     Dependency that returns the authenticated user.
     
+    The user is returned as a read-only UserResponse snapshot (id,
+    username, created_at, is_admin), detached from any session.
+    
     This is the primary authentication gate for protected endpoints.
     
     Flow:
     1. Extract Bearer token from Authorization header
     2. Decode and validate JWT token
-    3. Look up user in database
+    3. Return cached user for this ID, or load user by primary key
     4. Return user or raise 401 Unauthorized
     
     Usage in routes:
         @router.get("/protected")
-        async def protected_route(user: User = Depends(get_current_user)):
+        async def protected_route(user: UserResponse = Depends(get_current_user)):
             # user is guaranteed to be authenticated here
             return {"message": f"Hello {user.username}"}
     
@@ -59,44 +83,72 @@ async def get_current_user(
         headers={"WWW-Authenticate": "Bearer"},
     )
     
-    # Decode the token to get username
-    username = AuthService.decode_token(token)
-    if username is None:
+    # Decode the token to get the user ID
+    # Always runs, so expired or tampered tokens never hit the cache
+    user_id = AuthService.decode_token(token)
+    if user_id is None:
         raise credentials_exception
     
-    # Fetch user from database
-    query = select(User).where(User.username == username)
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
+    cached_user = _user_cache.get(user_id)
+    if cached_user is not None:
+        return cached_user
+    
+    # Fetch user by primary key
+    # Served from the session's identity map if already loaded,
+    # otherwise a single PK lookup
+    user = await db.get(User, user_id)
     
     if user is None:
         # User was deleted after token was issued
         raise credentials_exception
     
-    return user
+    snapshot = UserResponse.model_validate(user)
+    _user_cache[user_id] = snapshot
+    return snapshot
+
+
+async def get_current_claims(token: str = Depends(oauth2_scheme)) -> dict:
+    """
+    Dependency that returns the validated JWT claims.
+    
+    Lighter than get_current_user: no database access at all.
+    Use it for routes that only need the caller's ID or role.
+    
+    Raises:
+        HTTPException: 401 if token is invalid or expired
+    """
+    claims = AuthService.decode_claims(token)
+    if claims is None or claims.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
 
 
 async def get_current_admin_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    claims: dict = Depends(get_current_claims)
+) -> dict:
     """
-    Dependency that returns the authenticated user only if they are an admin.
+    Dependency that returns the token claims only if they grant admin.
     
-    This dependency chains from get_current_user, so it first validates
-    that the user is authenticated, then checks for admin privileges.
+    The is_admin claim is set at login, so admin routes are gated
+    without a database round trip. Revoking admin takes effect when
+    the token expires (ACCESS_TOKEN_EXPIRE_MINUTES).
     
     Usage in routes:
         @router.get("/admin/trades")
-        async def admin_trades(admin: User = Depends(get_current_admin_user)):
+        async def admin_trades(admin: dict = Depends(get_current_admin_user)):
             # Only admins can reach this point
             return {"message": "Admin access granted"}
     
     Raises:
-        HTTPException: 403 if user is not an admin
+        HTTPException: 401 if token is invalid, 403 if user is not an admin
     """
-    if not current_user.is_admin:
+    if not claims.get("is_admin"):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Admin privileges required"
         )
-    return current_user
+    return claims
@@ -10,7 +10,7 @@ Application Features:
 - Global exception handling
 - CORS configuration for frontend
 - Automatic OpenAPI documentation
-- Structured logging (file + stdout)
+- Structured logging (file + stdout, written off the event loop)
 
 Startup:
     uvicorn app.main:app --reload
@@ -20,16 +20,22 @@ OpenAPI Docs:
     http://localhost:8000/redoc (ReDoc)
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, APIRouter
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from app.config import get_settings
 from app.database import create_tables
 from app.routers import auth_router, trades_router, portfolio_router, admin_router
+from app.middleware.db_session import DBSessionMiddleware
 from app.middleware.exception_handler import (
     AppException,
     app_exception_handler,
@@ -41,14 +47,28 @@ from app.middleware.exception_handler import (
 # =============================================================================
 # Structured Logging Configuration
 # =============================================================================
-# Dual handlers: write to file (for production/reliability) and stdout (for dev)
+# Dual sinks: write to file (for production/reliability) and stdout (for dev)
+_log_formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
+_file_handler = logging.FileHandler("application_logs.txt")
+_file_handler.setFormatter(_log_formatter)
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+
+# Loggers only enqueue records; a background thread does the blocking
+# file/stdout writes, so request handlers never wait on disk I/O.
+# SimpleQueue is unbounded and needs no locking on put.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_queue_handler = QueueHandler(_log_queue)
+# Bare message only; timestamp and level are added by the sink formatter
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+_log_listener = QueueListener(_log_queue, _file_handler, _stream_handler)
+_log_listener.start()
+# Drain anything still queued on interpreter exit
+atexit.register(_log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(message)s",
-    handlers=[
-        logging.FileHandler("application_logs.txt"),
-        logging.StreamHandler(sys.stdout)
-    ]
+    handlers=[_queue_handler]
 )
 
 # Create logger instance for use throughout the application
@@ -66,16 +86,19 @@ async def lifespan(app: FastAPI):
     Application lifespan handler.
     
     Startup:
-    - Creates database tables if they don't exist
-    - In production, you'd use Alembic migrations instead
+    - Creates database tables if they don't exist (CREATE_TABLES_ON_STARTUP)
+    - In production, disable that and run migrations once per deploy instead
     
     Shutdown:
     - Any cleanup tasks would go here
     """
     # Startup: Create tables
     logger.info("🚀 Starting Crypto Trade Logger...")
-    await create_tables()
-    logger.info("✅ Database tables created/verified")
+    if settings.CREATE_TABLES_ON_STARTUP:
+        await create_tables()
+        logger.info("✅ Database tables created/verified")
+    else:
+        logger.info("Skipping table creation (CREATE_TABLES_ON_STARTUP=false)")
     
     yield  # Application runs here
     
@@ -84,6 +107,9 @@ async def lifespan(app: FastAPI):
 
 
 # Create FastAPI application
+# The default response class is kept on purpose: for routes with a
+# response_model, FastAPI (>=0.130) serializes straight to JSON bytes via
+# pydantic-core, which a custom class such as ORJSONResponse would disable.
 app = FastAPI(
     title=settings.APP_NAME,
     description="""
@@ -111,14 +137,21 @@ A trading position tracking system built for the Primetrade.ai internship assign
     redoc_url="/redoc"
 )
 
+# Closes the request's database session (if one was used) after the response
+# Registered before CORS so preflight requests are answered without reaching it
+app.add_middleware(DBSessionMiddleware)
+
 # Configure CORS for frontend access
-# In production, replace "*" with specific allowed origins
+# Explicit origins, methods and headers: no wildcard matching or echoing of
+# arbitrary request headers, and "*" isn't valid with credentials anyway.
+# max_age lets browsers reuse a preflight for a day instead of per request.
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000", "*"],
+    allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PATCH", "DELETE"],
+    allow_headers=["authorization", "content-type"],
+    max_age=86400,
 )
 
 # Register exception handlers
@@ -144,23 +177,35 @@ v1_router.include_router(admin_router)
 app.include_router(v1_router)
 
 
+# Health check bodies are constant, so serialize them once at import.
+# Probes then skip FastAPI's response validation and JSON encoding entirely,
+# which keeps load-balancer polling from competing with real traffic.
+_HEALTH_BODY = json.dumps({
+    "status": "healthy",
+    "app": settings.APP_NAME,
+    "version": "1.0.0"
+}, separators=(",", ":")).encode("utf-8")
+
+_DETAILED_HEALTH_BODY = json.dumps({
+    "status": "healthy",
+    "database": "connected",
+    "version": "1.0.0"
+}, separators=(",", ":")).encode("utf-8")
+
+
 @app.get("/", tags=["Health"])
-async def health_check():
+async def health_check() -> Response:
     """
     Health check endpoint.
     
     Returns:
         Basic API status information
     """
-    return {
-        "status": "healthy",
-        "app": settings.APP_NAME,
-        "version": "1.0.0"
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/health", tags=["Health"])
-async def detailed_health():
+async def detailed_health() -> Response:
     """
     Detailed health check for monitoring systems.
     
@@ -169,8 +214,4 @@ async def detailed_health():
     - Cache status (if applicable)
     - External service dependencies
     """
-    return {
-        "status": "healthy",
-        "database": "connected",
-        "version": "1.0.0"
-    }
+    return Response(content=_DETAILED_HEALTH_BODY, media_type="application/json")
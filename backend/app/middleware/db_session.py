@@ -0,0 +1,44 @@
+"""
+Database Session Middleware
+===========================
+Closes the request's database session once the response is sent.
+
+Why Middleware Instead of a Generator Dependency?
+- FastAPI has to set up and unwind an exit stack for every
+  yield-based dependency, on every request
+- Owning session cleanup here lets get_db be a plain async function
+- Written as a raw ASGI middleware (not BaseHTTPMiddleware) so it adds
+  a single await per request and doesn't buffer streaming responses
+
+Sessions are created lazily by get_db on first use and stored on
+request.state, so requests that never touch the DB (health checks,
+CORS preflights, claims-only routes) don't create one at all.
+"""
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class DBSessionMiddleware:
+    """
+    Close the session get_db attached to request.state.db, if any.
+
+    Cleanup runs once the response has been fully sent,
+    including when the endpoint raises.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # request.state is backed by scope["state"]
+        state = scope.setdefault("state", {})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            session = state.pop("db", None)
+            if session is not None:
+                await session.close()
@@ -20,14 +20,28 @@ Error Response Format:
 """
 
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
+from types import MappingProxyType
 import logging
+import orjson
 
 # Configure logging for error tracking
 logger = logging.getLogger(__name__)
 
+# Map common status codes to error codes
+# Built once at import (read-only) instead of on every handled exception
+_CODE_MAP = MappingProxyType({
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    422: "VALIDATION_ERROR",
+    500: "INTERNAL_ERROR"
+})
+
 
 class AppException(Exception):
     """
@@ -97,32 +111,36 @@ def create_error_response(
     code: str,
     message: str,
     details: dict = None
-) -> JSONResponse:
+) -> Response:
     """
     Create a standardized error response.
     
     This ensures all error responses follow the same structure,
     making it easier for frontend developers to handle errors.
+    
+    The envelope is a plain dict rather than a response model, so it is
+    encoded with orjson (C implementation) instead of stdlib json.
     """
-    return JSONResponse(
-        status_code=status_code,
-        content={
+    return Response(
+        content=orjson.dumps({
             "error": {
                 "code": code,
                 "message": message,
                 "details": details
             }
-        }
+        }),
+        status_code=status_code,
+        media_type="application/json"
     )
 
 
-async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+async def app_exception_handler(request: Request, exc: AppException) -> Response:
     """
     Handle custom application exceptions.
     
     Logs the error and returns a structured response.
     """
-    logger.warning(f"Application error: {exc.code} - {exc.message}")
+    logger.warning("Application error: %s - %s", exc.code, exc.message)
     return create_error_response(
         exc.status_code,
         exc.code,
@@ -134,24 +152,13 @@ async def app_exception_handler(request: Request, exc: AppException) -> JSONResp
 async def http_exception_handler(
     request: Request, 
     exc: StarletteHTTPException
-) -> JSONResponse:
+) -> Response:
     """
     Handle standard HTTP exceptions.
     
     Converts FastAPI's HTTPException to our standard format.
     """
-    # Map common status codes to error codes
-    code_map = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        405: "METHOD_NOT_ALLOWED",
-        422: "VALIDATION_ERROR",
-        500: "INTERNAL_ERROR"
-    }
-    
-    code = code_map.get(exc.status_code, "HTTP_ERROR")
+    code = _CODE_MAP.get(exc.status_code, "HTTP_ERROR")
     
     return create_error_response(
         exc.status_code,
@@ -163,7 +170,7 @@ async def http_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: RequestValidationError
-) -> JSONResponse:
+) -> Response:
     """
     Handle Pydantic validation errors.
     
@@ -179,7 +186,8 @@ async def validation_exception_handler(
             "message": error["msg"]
         })
     
-    logger.info(f"Validation error: {errors}")
+    # %-style args: the error list is only formatted if the record is emitted
+    logger.info("Validation error: %s", errors)
     
     return create_error_response(
         status_code=422,
@@ -189,7 +197,7 @@ async def validation_exception_handler(
     )
 
 
-async def generic_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def generic_exception_handler(request: Request, exc: Exception) -> Response:
     """
     Catch-all handler for unexpected exceptions.
     
@@ -198,7 +206,7 @@ async def generic_exception_handler(request: Request, exc: Exception) -> JSONRes
     for debugging, but users only see a generic message.
     """
     # Log the full exception for debugging
-    logger.exception(f"Unhandled exception: {exc}")
+    logger.exception("Unhandled exception: %s", exc)
     
     return create_error_response(
         status_code=500,
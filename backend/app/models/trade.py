@@ -15,14 +15,17 @@ Business Logic:
 - P&L depends on trade direction:
   - BUY (Long): Profit when exit_price > entry_price
   - SELL (Short): Profit when exit_price < entry_price
+- The same formula exists as a SQL expression (pnl_expression) so
+  closes and aggregations can be computed by the database
 """
 
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from sqlalchemy import String, DateTime, ForeignKey, Numeric, Enum as SQLEnum
+from sqlalchemy import String, DateTime, ForeignKey, Index, Numeric, case
+from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class TradeType(str, Enum):
@@ -59,15 +62,28 @@ class Trade(Base):
     """
     __tablename__ = "trades"
     
+    # Indexes matching the hot queries
+    # B-tree indexes scan in either direction, so these also serve the
+    # "newest first" (DESC) orderings without a sort step. Both end in id,
+    # the listing's tie-breaker, so ORDER BY created_at, id is fully covered.
+    # (The admin listing pages on the primary key and needs no extra index.)
+    __table_args__ = (
+        # Per-user listing, all statuses (the dashboard default).
+        # The leading user_id column also serves the foreign key.
+        Index("ix_trades_user_created", "user_id", "created_at", "id"),
+        # Per-user listing filtered by status (OPEN / CLOSED tabs)
+        Index("ix_trades_user_status_created", "user_id", "status", "created_at", "id"),
+    )
+    
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     
     # Foreign key linking trade to its owner
     # On delete cascade is handled at the relationship level
+    # Indexed via ix_trades_user_created (see __table_args__)
     user_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
-        nullable=False,
-        index=True  # Index for efficient per-user queries
+        nullable=False
     )
     
     # Trading pair symbol (e.g., BTC/USDT, ETH/USDT)
@@ -90,15 +106,20 @@ class Trade(Base):
     )
     
     # Trade direction - BUY for long, SELL for short
-    trade_type: Mapped[TradeType] = mapped_column(
-        SQLEnum(TradeType),
+    # Stored as plain strings rather than a SQL Enum: rows load without
+    # per-value enum conversion, and there is no PostgreSQL ENUM type to
+    # migrate. TradeType/TradeStatus are str enums, so comparisons like
+    # trade.trade_type == TradeType.BUY work on the loaded strings, and
+    # response schemas coerce them back to the enums.
+    trade_type: Mapped[str] = mapped_column(
+        String(8),
         nullable=False
     )
     
     # Current status - OPEN or CLOSED
-    status: Mapped[TradeStatus] = mapped_column(
-        SQLEnum(TradeStatus),
-        default=TradeStatus.OPEN,
+    status: Mapped[str] = mapped_column(
+        String(8),
+        default=TradeStatus.OPEN.value,
         nullable=False
     )
     
@@ -117,9 +138,10 @@ class Trade(Base):
     )
     
     # Timestamp when trade was opened
+    # Stamped by the database at insert, so no value is bound from Python
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=utcnow(),
         nullable=False
     )
     
@@ -156,8 +178,36 @@ class Trade(Base):
             # Short position: profit when price goes down
             return (self.entry_price - exit_price) * self.quantity
     
+    @classmethod
+    def pnl_expression(cls, exit_price: Decimal) -> ColumnElement[Decimal]:
+        """
+        SQL equivalent of calculate_pnl, evaluated by the database.
+        
+        Renders as:
+            CASE WHEN trade_type = 'BUY'
+                 THEN (exit_price - entry_price) * quantity
+                 ELSE (entry_price - exit_price) * quantity
+            END
+        
+        Used in UPDATE statements so the P&L is computed where the row
+        lives, without loading entry_price/quantity into Python first.
+        
+        Args:
+            exit_price: The price at which the position is being closed
+            
+        Returns:
+            SQL expression yielding the realized P&L
+        """
+        return case(
+            (
+                cls.trade_type == TradeType.BUY.value,
+                (exit_price - cls.entry_price) * cls.quantity
+            ),
+            else_=(cls.entry_price - exit_price) * cls.quantity
+        )
+    
     def __repr__(self) -> str:
         return (
             f"<Trade(id={self.id}, symbol='{self.symbol}', "
-            f"type={self.trade_type.value}, status={self.status.value})>"
+            f"type={self.trade_type}, status={self.status})>"
         )
@@ -6,7 +6,7 @@ Represents a trader/user in the system.
 Security Considerations:
 - Passwords are NEVER stored in plain text
 - Only the bcrypt hash is persisted
-- Username is unique to prevent duplicate accounts
+- Username is unique (case-insensitively) to prevent duplicate accounts
 
 Relationship to Trades:
 - One-to-many: A user can have multiple trades
@@ -15,9 +15,9 @@ Relationship to Trades:
 """
 
 from datetime import datetime
-from sqlalchemy import String, DateTime
+from sqlalchemy import String, DateTime, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from app.database import Base
+from app.database import Base, utcnow
 
 
 class User(Base):
@@ -36,11 +36,9 @@ class User(Base):
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     
     # Username must be unique - serves as login identifier
-    # Using index for faster lookups during authentication
+    # Uniqueness and lookups go through the lower(username) index below
     username: Mapped[str] = mapped_column(
         String(50), 
-        unique=True, 
-        index=True,
         nullable=False
     )
     
@@ -50,9 +48,10 @@ class User(Base):
     
     # Audit field - when was this account created
     # Essential for compliance and user support
+    # Stamped by the database at insert, so no value is bound from Python
     created_at: Mapped[datetime] = mapped_column(
         DateTime, 
-        default=datetime.utcnow,
+        server_default=utcnow(),
         nullable=False
     )
     
@@ -64,13 +63,20 @@ class User(Base):
     )
     
     # Relationship to trades - enables user.trades access
-    # lazy="selectin" provides efficient eager loading for async sessions
+    # Not eagerly loaded: every authenticated request loads a User, and
+    # almost none need its trades. Callers that do should query Trade by
+    # user_id, or use select(User).options(selectinload(User.trades)),
+    # since implicit lazy loads are not available on async sessions.
     trades: Mapped[list["Trade"]] = relationship(
         "Trade",
         back_populates="owner",
-        lazy="selectin",
         cascade="all, delete-orphan"
     )
     
     def __repr__(self) -> str:
         return f"<User(id={self.id}, username='{self.username}')>"
+
+
+# Case-insensitive uniqueness, and the index behind login lookups
+# (queries must compare lower(username) to be able to use it)
+Index("ix_users_username_lower", func.lower(User.username), unique=True)
@@ -9,16 +9,17 @@ Endpoints:
 All endpoints require admin privileges.
 
 Security Notes:
-- Uses get_current_admin_user dependency which checks is_admin flag
+- Uses get_current_admin_user dependency which checks the token's is_admin claim
 - Non-admins receive 403 Forbidden
 - Admins can view all trades regardless of owner for monitoring/compliance
 """
 
-from typing import List
-from fastapi import APIRouter, Depends
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
-from app.models.user import User
+from app.models.trade import Trade
 from app.schemas.trade import TradeResponse
 from app.services.trade_service import TradeService
 from app.dependencies import get_current_admin_user
@@ -26,32 +27,59 @@ from app.dependencies import get_current_admin_user
 router = APIRouter(prefix="/admin", tags=["Admin"])
 
 
+async def _ndjson_lines(trades: AsyncIterator[Trade]) -> AsyncIterator[bytes]:
+    """Serialize trades one JSON object per line as they arrive."""
+    async for trade in trades:
+        yield TradeResponse.model_validate(trade).model_dump_json().encode() + b"\n"
+
+
 @router.get(
     "/trades",
-    response_model=List[TradeResponse],
+    response_class=StreamingResponse,
     summary="Get all trades (Admin only)",
-    description="Fetch all trades in the system. Requires admin privileges."
+    description=(
+        "Stream a page of all trades in the system as newline-delimited JSON, "
+        "newest first. Pass the last ID of a page as after_id to fetch the next. "
+        "Requires admin privileges."
+    ),
+    responses={
+        200: {
+            "description": "One TradeResponse object per line",
+            "content": {"application/x-ndjson": {}},
+        }
+    }
 )
 async def get_all_trades(
-    admin_user: User = Depends(get_current_admin_user),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum trades to return"),
+    after_id: Optional[int] = Query(
+        None, ge=1, description="Keyset cursor: return trades with an ID below this"
+    ),
+    admin_claims: dict = Depends(get_current_admin_user),
     db: AsyncSession = Depends(get_db)
-) -> List[TradeResponse]:
+) -> StreamingResponse:
     """
     Get all trades in the system (admin only).
     
     This endpoint allows administrators to view all trading activity
     across all users for monitoring, compliance, and support purposes.
     
+    Pagination & Streaming:
+    - Keyset pagination on trade ID, so deep pages cost the same as the first
+    - Rows are streamed from the database and written out as NDJSON as
+      they are read, so the page is never buffered in full
+    
     Security:
-    - Only accessible by users with is_admin=True
+    - Only accessible with a token carrying is_admin=True
     - Non-admins receive 403 Forbidden response
     
     Args:
-        admin_user: Authenticated admin user (injected)
+        limit: Page size (1-1000)
+        after_id: ID of the last trade on the previous page
+        admin_claims: Validated admin token claims (injected)
         db: Database session (injected)
         
     Returns:
-        List of all trades in the system, ordered by most recent first
+        NDJSON stream of trades, ordered by most recent first
     """
-    trades = await TradeService.get_all_trades(db=db)
-    return trades
+    trades = TradeService.get_all_trades(db=db, limit=limit, after_id=after_id)
+    return StreamingResponse(_ndjson_lines(trades), media_type="application/x-ndjson")
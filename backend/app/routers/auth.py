@@ -9,6 +9,7 @@ Endpoints:
 
 Security Notes:
 - Passwords are hashed before storage (never stored in plain text)
+- bcrypt runs on a worker thread pool, never on the event loop
 - Login uses OAuth2PasswordRequestForm for standard compliance
 - Tokens expire after configured duration (default 30 minutes)
 """
@@ -17,7 +18,8 @@ import logging
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, bindparam, exists, func
+from sqlalchemy.dialects import postgresql, sqlite
 from app.database import get_db
 from app.models.user import User
 from app.schemas.user import UserCreate, UserResponse, Token
@@ -32,6 +34,31 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
+# Case-insensitive username lookup for login, served by the
+# unique lower(username) index
+# Selects only the columns login uses, returned as a plain row (no ORM
+# instance construction or identity-map bookkeeping)
+# Built once at import with a bound parameter: SQLAlchemy memoizes the
+# statement's cache key, so each call skips statement construction and
+# goes straight to the compiled-SQL cache
+_LOGIN_BY_USERNAME = select(
+    User.id, User.username, User.hashed_password, User.is_admin
+).where(
+    func.lower(User.username) == bindparam("username")
+)
+
+# Index-only check that a username is taken, run before hashing so
+# duplicate registrations don't spend a bcrypt hash
+_USERNAME_TAKEN = select(
+    exists().where(func.lower(User.username) == bindparam("username"))
+)
+
+# Dialect-specific INSERT constructs that support ON CONFLICT
+_INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
 
 @router.post(
     "/register",
@@ -52,6 +79,13 @@ async def register(
     - Password is hashed using bcrypt before storage
     - Returns created user data (without password hash)
     
+    A cheap EXISTS probe on the lower(username) index rejects taken
+    usernames before the password is hashed, so bursts of duplicate
+    registrations don't tie up the bcrypt pool that logins share.
+    Uniqueness itself is still enforced by the database in the statement
+    that creates the user (INSERT ... ON CONFLICT DO NOTHING RETURNING),
+    which covers two registrations racing past the probe.
+    
     Args:
         user_data: Validated username and password from request body
         db: Database session (injected)
@@ -62,26 +96,30 @@ async def register(
     Raises:
         UsernameExistsError: If username is already taken
     """
-    # Check if username already exists
-    query = select(User).where(User.username == user_data.username)
-    result = await db.execute(query)
-    existing_user = result.scalar_one_or_none()
-    
-    if existing_user:
+    if await db.scalar(_USERNAME_TAKEN, {"username": user_data.username}):
         logger.warning(f"Registration failed: username '{user_data.username}' already exists")
         raise UsernameExistsError(user_data.username)
     
     # Create new user with hashed password
-    hashed_password = AuthService.hash_password(user_data.password)
-    
-    new_user = User(
-        username=user_data.username,
-        hashed_password=hashed_password
+    hashed_password = await AuthService.hash_password_async(user_data.password)
+    
+    # Insert unless the username is taken; RETURNING hands back the new
+    # row (including server defaults), or nothing on conflict
+    insert = _INSERT_BY_DIALECT[db.get_bind().dialect.name]
+    stmt = (
+        insert(User)
+        .values(username=user_data.username, hashed_password=hashed_password)
+        .on_conflict_do_nothing()
+        .returning(User)
     )
+    new_user = (await db.execute(stmt)).scalar_one_or_none()
+    
+    if new_user is None:
+        await db.rollback()
+        logger.warning(f"Registration failed: username '{user_data.username}' already exists")
+        raise UsernameExistsError(user_data.username)
     
-    db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
     
     logger.info(f"New user registered: '{new_user.username}' (ID: {new_user.id})")
     
@@ -119,22 +157,41 @@ async def login(
         InvalidCredentialsError: If username doesn't exist or password is wrong
     """
     # Find user by username
-    query = select(User).where(User.username == form_data.username.lower())
-    result = await db.execute(query)
-    user = result.scalar_one_or_none()
+    result = await db.execute(
+        _LOGIN_BY_USERNAME, {"username": form_data.username.lower()}
+    )
+    user = result.first()
     
     # Verify user exists and password matches
     if not user:
         logger.warning(f"Login failed: user '{form_data.username}' not found")
         raise InvalidCredentialsError()
     
-    if not AuthService.verify_password(form_data.password, user.hashed_password):
+    if not await AuthService.verify_password_async(
+        form_data.password, user.hashed_password
+    ):
         logger.warning(f"Login failed: invalid password for user '{form_data.username}'")
         raise InvalidCredentialsError()
     
-    # Generate access token with admin status included
+    # Upgrade the stored hash if BCRYPT_COST has changed since it was made
+    if AuthService.needs_rehash(user.hashed_password):
+        new_hash = await AuthService.hash_password_async(form_data.password)
+        await db.execute(
+            update(User)
+            .where(User.id == user.id)
+            .values(hashed_password=new_hash)
+        )
+        await db.commit()
+        logger.info(f"Password hash upgraded to current cost for user '{user.username}'")
+    
+    # Generate access token keyed by user ID
+    # username and is_admin are included for display in the frontend
     access_token = AuthService.create_access_token(
-        data={"sub": user.username, "is_admin": user.is_admin}
+        data={
+            "sub": str(user.id),
+            "username": user.username,
+            "is_admin": user.is_admin
+        }
     )
     
     logger.info(f"User logged in: '{user.username}' (admin={user.is_admin})")
@@ -20,7 +20,7 @@ In a real trading platform, this would expand to include:
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
-from app.models.user import User
+from app.schemas.user import UserResponse
 from app.schemas.trade import PortfolioSummary
 from app.services.trade_service import TradeService
 from app.dependencies import get_current_user
@@ -35,7 +35,7 @@ router = APIRouter(prefix="/portfolio", tags=["Portfolio Analytics"])
     description="Calculate realized P&L and trading statistics for the authenticated user."
 )
 async def get_portfolio_summary(
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> PortfolioSummary:
     """
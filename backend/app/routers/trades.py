@@ -5,7 +5,7 @@ CRUD operations for trading positions.
 
 Endpoints:
 - POST /trades - Open a new trading position
-- GET /trades - List all trades for authenticated user
+- GET /trades - List the authenticated user's trades (cursor-paginated)
 - PATCH /trades/{id}/close - Close an open trade
 
 All endpoints require authentication.
@@ -17,13 +17,13 @@ Business Logic:
 """
 
 import logging
-from typing import List, Optional
-from fastapi import APIRouter, Depends, status
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
-from app.models.user import User
-from app.models.trade import TradeStatus
-from app.schemas.trade import TradeCreate, TradeResponse, TradeClose
+from app.models.trade import TradeStatus, TradeType
+from app.schemas.user import UserResponse
+from app.schemas.trade import TradeCreate, TradeResponse, TradeClose, TradePage
 from app.services.trade_service import TradeService
 from app.dependencies import get_current_user
 from app.middleware.exception_handler import (
@@ -46,7 +46,7 @@ router = APIRouter(prefix="/trades", tags=["Trades"])
 )
 async def create_trade(
     trade_data: TradeCreate,
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> TradeResponse:
     """
@@ -77,7 +77,7 @@ async def create_trade(
     )
     
     # Log trade creation with explicit BUY/SELL indicator
-    if trade.trade_type.value == "BUY":
+    if trade.trade_type == TradeType.BUY:
         logger.info(
             f"🟢 BUY TRADE OPENED: user='{current_user.username}' symbol={trade.symbol} "
             f"entry_price={trade.entry_price} quantity={trade.quantity} (ID: {trade.id})"
@@ -93,22 +93,37 @@ async def create_trade(
 
 @router.get(
     "",
-    response_model=List[TradeResponse],
+    responses={200: {"model": TradePage}},
     summary="Get all trades",
-    description="Fetch all trades for the authenticated user."
+    description=(
+        "Fetch the authenticated user's trades, newest first, one page at a "
+        "time. Pass next_cursor back as `after` to get the next page."
+    )
 )
 async def get_trades(
     status: Optional[TradeStatus] = None,
-    current_user: User = Depends(get_current_user),
+    limit: int = Query(100, ge=1, le=500, description="Maximum trades per page"),
+    after: Optional[int] = Query(
+        None, ge=1, description="Cursor: next_cursor from the previous page"
+    ),
+    current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
-) -> List[TradeResponse]:
+) -> Response:
     """
-    Get all trades for the current user.
+    Get the current user's trades, one page at a time.
     
     Returns trades in reverse chronological order (newest first).
     
+    Serialization:
+    The page is converted in a single pydantic-core validate/dump pass
+    and returned as raw JSON bytes, so FastAPI does not run its
+    per-request response_model validation on top (the schema is still
+    documented via responses=).
+    
     Query Parameters:
     - status: Optional filter by OPEN or CLOSED trades
+    - limit: Page size (1-500, default 100)
+    - after: Keyset cursor (next_cursor from the previous page)
     
     Security:
     This endpoint ONLY returns trades belonging to the authenticated user.
@@ -116,16 +131,20 @@ async def get_trades(
     
     Args:
         status: Optional status filter
+        limit: Page size
+        after: ID of the last trade on the previous page
         current_user: Authenticated user (injected)
         db: Database session (injected)
         
     Returns:
-        List of trades belonging to the user
+        A page of trades belonging to the user, plus the next cursor
     """
-    trades = await TradeService.get_user_trades(
+    trades, next_cursor = await TradeService.get_user_trades(
         db=db,
         user_id=current_user.id,
-        status=status
+        status=status,
+        limit=limit,
+        after=after
     )
     
     logger.info(
@@ -133,7 +152,10 @@ async def get_trades(
         f"filter={status.value if status else 'all'}"
     )
     
-    return trades
+    page = TradePage.model_validate(
+        {"items": trades, "next_cursor": next_cursor}, from_attributes=True
+    )
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.patch(
@@ -145,7 +167,7 @@ async def get_trades(
 async def close_trade(
     trade_id: int,
     close_data: TradeClose,
-    current_user: User = Depends(get_current_user),
+    current_user: UserResponse = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ) -> TradeResponse:
     """
@@ -178,28 +200,30 @@ async def close_trade(
         TradeNotFoundError: Trade doesn't exist or doesn't belong to user
         TradeAlreadyClosedError: Trade is already closed
     """
-    # Fetch trade, ensuring it belongs to current user
-    trade = await TradeService.get_trade_by_id(
+    # Close the trade and calculate P&L, if it is the user's and OPEN
+    updated_trade = await TradeService.close_trade(
         db=db,
         trade_id=trade_id,
-        user_id=current_user.id
+        user_id=current_user.id,
+        exit_price=close_data.exit_price
     )
     
-    if not trade:
-        logger.warning(f"Trade not found: user='{current_user.username}' trade_id={trade_id}")
-        raise TradeNotFoundError(trade_id)
-    
-    if trade.status == TradeStatus.CLOSED:
+    if updated_trade is None:
+        # Nothing was updated: the trade is missing, someone else's,
+        # or (if the user does own it) already closed
+        owns_trade = await TradeService.user_owns_trade(
+            db=db,
+            trade_id=trade_id,
+            user_id=current_user.id
+        )
+        
+        if not owns_trade:
+            logger.warning(f"Trade not found: user='{current_user.username}' trade_id={trade_id}")
+            raise TradeNotFoundError(trade_id)
+        
         logger.warning(f"Trade already closed: user='{current_user.username}' trade_id={trade_id}")
         raise TradeAlreadyClosedError(trade_id)
     
-    # Close the trade and calculate P&L
-    updated_trade = await TradeService.close_trade(
-        db=db,
-        trade=trade,
-        exit_price=close_data.exit_price
-    )
-    
     logger.info(
         f"Trade closed: user='{current_user.username}' symbol={updated_trade.symbol} "
         f"entry={updated_trade.entry_price} exit={updated_trade.exit_price} "
@@ -4,6 +4,7 @@ from app.schemas.trade import (
     TradeCreate, 
     TradeResponse, 
     TradeClose, 
+    TradePage,
     PortfolioSummary
 )
 
@@ -15,5 +16,6 @@ __all__ = [
     "TradeCreate", 
     "TradeResponse", 
     "TradeClose",
+    "TradePage",
     "PortfolioSummary",
 ]
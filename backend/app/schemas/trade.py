@@ -6,6 +6,9 @@ Pydantic models for trade-related request/response validation.
 Financial Data Validation:
 - All prices and quantities must be positive (no negative trades)
 - Using Decimal for precision in financial calculations
+- Precision limits mirror the Numeric(18, 8) columns and are enforced
+  by pydantic-core, so out-of-range values fail validation instead of
+  reaching the database
 - Symbol validation ensures consistent formatting
 
 P&L Representation:
@@ -14,12 +17,16 @@ P&L Representation:
 - Currency is always the quote currency (e.g., USDT in BTC/USDT)
 """
 
+import re
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from app.models.trade import TradeType, TradeStatus
 
+# BASE/QUOTE, letters only (e.g., BTC/USDT), compiled once at import
+_SYMBOL_RE = re.compile(r"[A-Z]+/[A-Z]+")
+
 
 class TradeCreate(BaseModel):
     """
@@ -38,20 +45,29 @@ class TradeCreate(BaseModel):
             "trade_type": "BUY"
         }
     """
+    # Whitespace is stripped by pydantic-core while parsing
+    model_config = ConfigDict(frozen=True, str_strip_whitespace=True)
+    
     symbol: str = Field(
         ...,
         min_length=3,
         max_length=20,
         description="Trading pair symbol (e.g., BTC/USDT)"
     )
+    # At most 8 decimal places: Bitcoin's smallest unit (satoshi) and
+    # the industry standard for crypto trading
     entry_price: Decimal = Field(
         ...,
         gt=0,  # Price must be greater than 0
+        max_digits=18,
+        decimal_places=8,
         description="Price at which the position is opened"
     )
     quantity: Decimal = Field(
         ...,
         gt=0,  # Quantity must be greater than 0
+        max_digits=18,
+        decimal_places=8,
         description="Amount of base asset to trade"
     )
     trade_type: TradeType = Field(
@@ -68,29 +84,16 @@ class TradeCreate(BaseModel):
         Expected format: BASE/QUOTE (e.g., BTC/USDT, ETH/BTC)
         This matches the convention used by most crypto exchanges.
         """
-        symbol = v.upper().strip()
+        symbol = v.upper()
         if "/" not in symbol:
             raise ValueError(
                 "Symbol must be in BASE/QUOTE format (e.g., BTC/USDT)"
             )
-        parts = symbol.split("/")
-        if len(parts) != 2 or not all(part.isalpha() for part in parts):
+        if _SYMBOL_RE.fullmatch(symbol) is None:
             raise ValueError(
                 "Invalid symbol format. Use BASE/QUOTE (e.g., BTC/USDT)"
             )
         return symbol
-    
-    @field_validator("entry_price", "quantity")
-    @classmethod
-    def validate_precision(cls, v: Decimal) -> Decimal:
-        """
-        Ensure reasonable precision for financial values.
-        
-        Limiting to 8 decimal places matches Bitcoin's smallest unit (satoshi)
-        and is the industry standard for crypto trading.
-        """
-        # Round to 8 decimal places to prevent floating point artifacts
-        return round(v, 8)
 
 
 class TradeClose(BaseModel):
@@ -105,17 +108,15 @@ class TradeClose(BaseModel):
             "exit_price": 55000.00
         }
     """
+    model_config = ConfigDict(frozen=True)
+    
     exit_price: Decimal = Field(
         ...,
         gt=0,
+        max_digits=18,
+        decimal_places=8,  # Consistent precision with entry price
         description="Price at which the position is being closed"
     )
-    
-    @field_validator("exit_price")
-    @classmethod
-    def validate_precision(cls, v: Decimal) -> Decimal:
-        """Ensure consistent precision with entry price."""
-        return round(v, 8)
 
 
 class TradeResponse(BaseModel):
@@ -136,8 +137,23 @@ class TradeResponse(BaseModel):
     created_at: datetime
     closed_at: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class TradePage(BaseModel):
+    """
+    One page of a user's trades, newest first.
+    
+    Pass next_cursor back as the `after` query parameter to fetch the
+    following page; it is null on the last page.
+    """
+    items: List[TradeResponse]
+    next_cursor: Optional[int] = Field(
+        default=None,
+        description="ID to pass as `after` for the next page (null if none)"
+    )
+    
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PortfolioSummary(BaseModel):
@@ -154,7 +170,11 @@ class PortfolioSummary(BaseModel):
     - winning_trades: Number of trades closed with profit
     - losing_trades: Number of trades closed with loss
     - win_rate: Percentage of profitable trades
+    
+    Frozen: summaries are cached and shared between requests.
     """
+    model_config = ConfigDict(frozen=True)
+    
     total_realized_pnl: Decimal = Field(
         description="Total profit/loss from all closed trades"
     )
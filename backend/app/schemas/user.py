@@ -9,8 +9,13 @@ Design Philosophy:
 - Clear error messages help API consumers debug issues quickly
 """
 
+import re
 from datetime import datetime
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Letters, digits, underscores and hyphens, with at least one letter or
+# digit (a name made only of separators is rejected), compiled once at import
+_USERNAME_RE = re.compile(r"(?=.*[A-Za-z0-9])[A-Za-z0-9_-]+")
 
 
 class UserCreate(BaseModel):
@@ -40,7 +45,7 @@ class UserCreate(BaseModel):
         Ensure username contains only valid characters.
         This prevents injection attacks and simplifies display logic.
         """
-        if not v.replace("_", "").replace("-", "").isalnum():
+        if _USERNAME_RE.fullmatch(v) is None:
             raise ValueError(
                 "Username can only contain letters, numbers, underscores, and hyphens"
             )
@@ -71,8 +76,8 @@ class UserResponse(BaseModel):
     created_at: datetime
     is_admin: bool = False
     
-    class Config:
-        from_attributes = True  # Enable ORM mode for SQLAlchemy models
+    # from_attributes: Enable ORM mode for SQLAlchemy models
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class Token(BaseModel):
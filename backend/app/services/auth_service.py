@@ -12,16 +12,94 @@ Why bcrypt?
 - Designed specifically for password hashing (unlike SHA256)
 - Has built-in salt generation (prevents rainbow table attacks)
 - Configurable work factor (can be increased as hardware improves)
+  via BCRYPT_COST; hashes at another cost are flagged by needs_rehash
+
+Token Verification Cache:
+- The same bearer token is presented on every request for its lifetime
+- Verified claims are memoized per token, skipping the HMAC check and
+  JSON parsing on repeat requests
+- Entries expire after TOKEN_CACHE_TTL_SECONDS or at the token's exp,
+  whichever comes first, so expired tokens are never accepted
+- Keyed by the token's SHA-256 digest, so raw bearer tokens are not
+  retained in memory and keys have a fixed size
+
+Password Verification Cache:
+- Successful bcrypt checks are remembered for
+  PASSWORD_VERIFY_CACHE_TTL_SECONDS (0 disables the cache)
+- Keyed by HMAC-SHA256(stored hash, password): the plaintext is never
+  stored, and changing the password changes the key
+- Only matches are cached, so wrong guesses always pay the full bcrypt cost
+
+Event Loop Safety:
+- bcrypt is deliberately CPU-heavy (~250ms at cost 12)
+- The *_async variants run it on a dedicated thread pool sized to the
+  CPU count, so other requests keep being served during a hash and
+  a burst of logins can't queue unbounded work on the default executor
 """
 
-from datetime import datetime, timedelta
+import asyncio
+import hashlib
+import hmac
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
 from typing import Optional
-from jose import JWTError, jwt
+from cachetools import TLRUCache, TTLCache
+import jwt
+from jwt import PyJWTError
 import bcrypt
 from app.config import get_settings
 
 settings = get_settings()
 
+# Settings used on every token/password operation, bound once at import
+# (settings are immutable for the life of the process)
+_JWT_SECRET_KEY = settings.JWT_SECRET_KEY
+_JWT_ALGORITHM = settings.JWT_ALGORITHM
+_JWT_ALGORITHMS = [settings.JWT_ALGORITHM]
+_TOKEN_LIFETIME_SECONDS = settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+_TOKEN_CACHE_TTL_SECONDS = settings.TOKEN_CACHE_TTL_SECONDS
+_BCRYPT_COST = settings.BCRYPT_COST
+
+# Upper bound on accepted token length; ours are a few hundred bytes
+_MAX_TOKEN_LENGTH = 4096
+
+
+def _claims_expiry(key: bytes, claims: dict, now: float) -> float:
+    """Cache entries expire at the cache TTL or the token's exp, if sooner."""
+    return min(now + _TOKEN_CACHE_TTL_SECONDS, claims["exp"])
+
+
+# Verified claims keyed by SHA-256 digest of the token
+# Uses wall-clock time so expiry can be compared with the exp claim directly
+_claims_cache: TLRUCache = TLRUCache(
+    maxsize=4096,
+    ttu=_claims_expiry,
+    timer=time.time
+)
+
+
+# Successful password checks keyed by HMAC(stored hash, password)
+# Process-local on purpose; None when disabled in settings
+_verify_cache: Optional[TTLCache] = (
+    TTLCache(maxsize=2048, ttl=settings.PASSWORD_VERIFY_CACHE_TTL_SECONDS)
+    if settings.PASSWORD_VERIFY_CACHE_TTL_SECONDS > 0
+    else None
+)
+
+
+def _verify_cache_key(password_bytes: bytes, hashed_bytes: bytes) -> bytes:
+    """HMAC of the password keyed by its stored hash (never the plaintext)."""
+    return hmac.new(hashed_bytes, password_bytes, hashlib.sha256).digest()
+
+
+# Bounded pool for bcrypt work: at most one hash per core runs at a time
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="bcrypt"
+)
+
 
 class AuthService:
     """
@@ -48,8 +126,8 @@ class AuthService:
         """
         # bcrypt requires bytes, encode the password
         password_bytes = password.encode('utf-8')
-        # Generate salt and hash
-        salt = bcrypt.gensalt()
+        # Generate salt (at the configured work factor) and hash
+        salt = bcrypt.gensalt(rounds=_BCRYPT_COST)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode('utf-8')
     
@@ -70,7 +148,78 @@ class AuthService:
         """
         password_bytes = plain_password.encode('utf-8')
         hashed_bytes = hashed_password.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
+        
+        if _verify_cache is None:
+            return bcrypt.checkpw(password_bytes, hashed_bytes)
+        
+        key = _verify_cache_key(password_bytes, hashed_bytes)
+        if key in _verify_cache:
+            return True
+        
+        if not bcrypt.checkpw(password_bytes, hashed_bytes):
+            return False
+        _verify_cache[key] = True
+        return True
+    
+    @staticmethod
+    async def hash_password_async(password: str) -> str:
+        """
+        Hash a password on the bcrypt thread pool.
+        
+        Same result as hash_password, without blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _bcrypt_executor, AuthService.hash_password, password
+        )
+    
+    @staticmethod
+    async def verify_password_async(
+        plain_password: str,
+        hashed_password: str
+    ) -> bool:
+        """
+        Verify a password on the bcrypt thread pool.
+        
+        Same result as verify_password, without blocking the event loop.
+        Cached matches are answered inline, skipping the thread hop.
+        """
+        if _verify_cache is not None:
+            key = _verify_cache_key(
+                plain_password.encode('utf-8'),
+                hashed_password.encode('utf-8')
+            )
+            if key in _verify_cache:
+                return True
+        
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _bcrypt_executor,
+            AuthService.verify_password,
+            plain_password,
+            hashed_password
+        )
+    
+    @staticmethod
+    def needs_rehash(hashed_password: str) -> bool:
+        """
+        Check whether a stored hash was made with a different work factor.
+        
+        bcrypt hashes look like $2b$12$<salt+digest>, where 12 is the cost.
+        Lets BCRYPT_COST be raised or lowered without invalidating
+        existing passwords: callers re-hash after a successful login.
+        
+        Args:
+            hashed_password: Hash stored in database
+            
+        Returns:
+            True if the hash's cost differs from BCRYPT_COST
+        """
+        try:
+            cost = int(hashed_password.split("$")[2])
+        except (IndexError, ValueError):
+            return True
+        return cost != _BCRYPT_COST
     
     @staticmethod
     def create_access_token(
@@ -82,7 +231,7 @@ class AuthService:
         
         Token Structure (decoded):
         {
-            "sub": "username",  # Subject - who the token is for
+            "sub": "42",        # Subject - user ID, as a string per RFC 7519
             "exp": 1234567890   # Expiration timestamp
         }
         
@@ -98,50 +247,95 @@ class AuthService:
         """
         to_encode = data.copy()
         
-        # Set expiration time
+        # Set expiration time as integer epoch seconds, the claim's wire
+        # format, so no datetime conversion happens during encoding
         if expires_delta:
-            expire = datetime.utcnow() + expires_delta
+            lifetime = int(expires_delta.total_seconds())
         else:
-            expire = datetime.utcnow() + timedelta(
-                minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-            )
+            lifetime = _TOKEN_LIFETIME_SECONDS
         
-        to_encode.update({"exp": expire})
+        to_encode.update({"exp": int(time.time()) + lifetime})
         
         # Create and sign the token
         encoded_jwt = jwt.encode(
             to_encode,
-            settings.JWT_SECRET_KEY,
-            algorithm=settings.JWT_ALGORITHM
+            _JWT_SECRET_KEY,
+            algorithm=_JWT_ALGORITHM
         )
         
         return encoded_jwt
     
     @staticmethod
-    def decode_token(token: str) -> Optional[str]:
+    def decode_claims(token: str) -> Optional[dict]:
         """
-        Decode and validate a JWT token.
+        Decode and validate a JWT token, returning all of its claims.
         
         This verifies:
         1. Token signature is valid (not tampered)
         2. Token is not expired
         
+        Authorization claims such as is_admin can be trusted for the
+        token's (short) lifetime without a database lookup.
+        
+        Valid tokens are memoized (see module docstring); invalid tokens
+        are never cached. The returned dict is shared, so don't mutate it.
+        
         Args:
             token: The JWT token string from Authorization header
             
         Returns:
-            Username from token if valid, None if invalid/expired
+            Claims dictionary if valid, None if invalid/expired
         """
+        # A JWS compact token is exactly three dot-separated segments.
+        # Reject anything else (and oversized input) before hashing,
+        # base64 decoding or verifying it.
+        if (
+            not token
+            or len(token) > _MAX_TOKEN_LENGTH
+            or token.count(".") != 2
+        ):
+            return None
+        
+        key = hashlib.sha256(token.encode()).digest()
+        claims = _claims_cache.get(key)
+        if claims is not None:
+            return claims
+        
         try:
-            payload = jwt.decode(
+            claims = jwt.decode(
                 token,
-                settings.JWT_SECRET_KEY,
-                algorithms=[settings.JWT_ALGORITHM]
+                _JWT_SECRET_KEY,
+                algorithms=_JWT_ALGORITHMS
             )
-            username: str = payload.get("sub")
-            if username is None:
-                return None
-            return username
-        except JWTError:
+        except PyJWTError:
             # Token is invalid or expired
             return None
+        
+        # Tokens without exp can't be bounded, so they aren't cached
+        if "exp" in claims:
+            _claims_cache[key] = claims
+        return claims
+    
+    @staticmethod
+    def decode_token(token: str) -> Optional[int]:
+        """
+        Decode and validate a JWT token, returning the user ID.
+        
+        Args:
+            token: The JWT token string from Authorization header
+            
+        Returns:
+            User ID from token if valid, None if invalid/expired
+        """
+        payload = AuthService.decode_claims(token)
+        if payload is None:
+            return None
+        
+        subject = payload.get("sub")
+        if subject is None:
+            return None
+        try:
+            return int(subject)
+        except ValueError:
+            # Token predates ID subjects
+            return None
@@ -10,16 +10,100 @@ Design Pattern: Service Layer
 - Separates business logic from HTTP handling
 - Makes it easy to test business rules in isolation
 - Allows reuse of logic across different entry points (API, CLI, etc.)
+
+Portfolio Summary Cache:
+- Summaries are cached per user for PORTFOLIO_CACHE_TTL_SECONDS
+- create_trade and close_trade evict the user's entry after committing,
+  so a user's own changes are visible immediately
+- Entries are only ever evicted, never adjusted in place: a summary
+  read by a concurrent request between the commit and the eviction may
+  already include the change, so patching it would count it twice
+- The cache is per process: with several workers, a summary served by
+  another worker can lag by at most the TTL
 """
 
-from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
-from sqlalchemy import select, func
+from typing import AsyncIterator, List, Optional, Tuple
+from cachetools import TTLCache
+from sqlalchemy import (
+    Float, Numeric, Row, Select, bindparam, cast, exists, insert, literal,
+    select, func, tuple_, update
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.config import get_settings
+from app.database import utcnow
 from app.models.trade import Trade, TradeStatus, TradeType
 from app.schemas.trade import TradeCreate, PortfolioSummary
 
+settings = get_settings()
+
+# Portfolio summaries keyed by user ID
+_summary_cache: TTLCache = TTLCache(
+    maxsize=10_000,
+    ttl=settings.PORTFOLIO_CACHE_TTL_SECONDS
+)
+
+# Columns the trade listing serializes (the fields of TradeResponse)
+_LISTING_COLUMNS = (
+    Trade.id,
+    Trade.symbol,
+    Trade.entry_price,
+    Trade.quantity,
+    Trade.trade_type,
+    Trade.status,
+    Trade.exit_price,
+    Trade.realized_pnl,
+    Trade.created_at,
+    Trade.closed_at,
+)
+
+
+def _build_listing_query(by_status: bool, after_cursor: bool) -> Select:
+    """
+    Build the user trade listing query for one combination of filters.
+    
+    Every value is a bound parameter (user_id, status, after, limit), so
+    each variant can be built once and reused for every request.
+    """
+    query = select(*_LISTING_COLUMNS).where(
+        Trade.user_id == bindparam("user_id")
+    )
+    
+    if by_status:
+        query = query.where(Trade.status == bindparam("status"))
+    
+    if after_cursor:
+        # Resume strictly after the cursor trade's (created_at, id)
+        cursor_created_at = (
+            select(Trade.created_at)
+            .where(
+                Trade.id == bindparam("after"),
+                Trade.user_id == bindparam("user_id")
+            )
+            .scalar_subquery()
+        )
+        query = query.where(
+            tuple_(Trade.created_at, Trade.id)
+            < tuple_(cursor_created_at, bindparam("after"))
+        )
+    
+    # Order by most recent first - traders want to see latest trades
+    # id breaks ties between trades stamped in the same instant
+    return query.order_by(
+        Trade.created_at.desc(), Trade.id.desc()
+    ).limit(bindparam("limit"))
+
+
+# Listing queries keyed by (filtered by status, has cursor)
+# Built once at import: SQLAlchemy memoizes each statement's cache key,
+# so requests skip statement construction and go straight to the
+# compiled-SQL cache
+_LISTING_QUERIES = {
+    (by_status, after_cursor): _build_listing_query(by_status, after_cursor)
+    for by_status in (False, True)
+    for after_cursor in (False, True)
+}
+
 
 class TradeService:
     """
@@ -52,18 +136,24 @@ class TradeService:
         Returns:
             The created Trade model instance
         """
-        trade = Trade(
-            user_id=user_id,
-            symbol=trade_data.symbol,
-            entry_price=trade_data.entry_price,
-            quantity=trade_data.quantity,
-            trade_type=trade_data.trade_type,
-            status=TradeStatus.OPEN
+        # INSERT ... RETURNING hands back the stored row (id, the
+        # server-stamped created_at, and prices at column scale), so no
+        # refresh SELECT is needed after the commit
+        stmt = (
+            insert(Trade)
+            .values(
+                user_id=user_id,
+                symbol=trade_data.symbol,
+                entry_price=trade_data.entry_price,
+                quantity=trade_data.quantity,
+                trade_type=trade_data.trade_type.value,
+                status=TradeStatus.OPEN.value
+            )
+            .returning(Trade)
         )
-        
-        db.add(trade)
+        trade = (await db.execute(stmt)).scalar_one()
         await db.commit()
-        await db.refresh(trade)
+        _summary_cache.pop(user_id, None)
         
         return trade
     
@@ -71,83 +161,127 @@ class TradeService:
     async def get_user_trades(
         db: AsyncSession,
         user_id: int,
-        status: Optional[TradeStatus] = None
-    ) -> List[Trade]:
+        status: Optional[TradeStatus] = None,
+        limit: int = 100,
+        after: Optional[int] = None
+    ) -> Tuple[List[Row], Optional[int]]:
         """
-        Get all trades for a specific user.
+        Get one page of trades for a specific user.
         
         Security Note:
         This method ONLY returns trades belonging to the specified user.
         This is critical for data isolation - users should never see
         each other's trading activity.
         
+        Pagination:
+        Keyset pagination in listing order (created_at, id), newest first.
+        The cursor is the ID of the last trade on the previous page; its
+        position is looked up in the same query, so every page is a
+        bounded range scan of the user's listing index instead of an
+        OFFSET that re-reads all earlier rows.
+        
+        Performance:
+        The page is only ever serialized, so it is selected as plain
+        column rows rather than Trade instances. That skips identity-map
+        bookkeeping and attribute instrumentation for every row, and
+        TradeResponse reads the rows' named fields directly.
+        
         Args:
             db: Database session
             user_id: ID of the user whose trades to fetch
             status: Optional filter for OPEN or CLOSED trades
+            limit: Maximum number of trades to return
+            after: ID of the last trade on the previous page
             
         Returns:
-            List of Trade instances belonging to the user
+            Tuple of (trade rows on this page, cursor for the next page
+            or None if this is the last page)
         """
-        query = select(Trade).where(Trade.user_id == user_id)
+        query = _LISTING_QUERIES[(status is not None, after is not None)]
         
-        if status:
-            query = query.where(Trade.status == status)
+        # One extra row tells us whether another page exists
+        result = await db.execute(query, {
+            "user_id": user_id,
+            "status": status.value if status is not None else None,
+            "after": after,
+            "limit": limit + 1,
+        })
+        trades = list(result.all())
         
-        # Order by most recent first - traders want to see latest trades
-        query = query.order_by(Trade.created_at.desc())
-        
-        result = await db.execute(query)
-        return list(result.scalars().all())
+        if len(trades) > limit:
+            trades = trades[:limit]
+            return trades, trades[-1].id
+        return trades, None
     
     @staticmethod
-    async def get_all_trades(db: AsyncSession) -> List[Trade]:
+    async def get_all_trades(
+        db: AsyncSession,
+        limit: int = 100,
+        after_id: Optional[int] = None
+    ) -> AsyncIterator[Trade]:
         """
-        Get all trades in the system (admin only).
+        Stream one page of all trades in the system (admin only).
         
-        This method returns ALL trades regardless of user ownership.
+        This method returns trades regardless of user ownership.
         Should only be called from admin endpoints.
         
+        Pagination:
+        Keyset pagination on the primary key, newest first. Pass the last
+        ID of the previous page as after_id to get the next one. Unlike
+        OFFSET, every page is a bounded primary-key index range scan.
+        
+        Rows are streamed from the database as they are consumed instead
+        of being materialized into a list.
+        
         Args:
             db: Database session
+            limit: Maximum number of trades to return
+            after_id: Only return trades with an ID below this one
             
-        Returns:
-            List of all Trade instances in the system
+        Yields:
+            Trade instances, ordered by ID descending
         """
-        query = select(Trade).order_by(Trade.created_at.desc())
-        result = await db.execute(query)
-        return list(result.scalars().all())
+        query = select(Trade).order_by(Trade.id.desc()).limit(limit)
+        
+        if after_id is not None:
+            query = query.where(Trade.id < after_id)
+        
+        result = await db.stream_scalars(query)
+        async for trade in result:
+            yield trade
     
     @staticmethod
-    async def get_trade_by_id(
+    async def user_owns_trade(
         db: AsyncSession,
         trade_id: int,
         user_id: int
-    ) -> Optional[Trade]:
+    ) -> bool:
         """
-        Get a specific trade by ID, ensuring it belongs to the user.
+        Check whether a trade exists and belongs to the user.
+        
+        A SELECT EXISTS answered from the primary key, for callers that
+        only need ownership and not the trade itself.
         
         Args:
             db: Database session
-            trade_id: ID of the trade to fetch
+            trade_id: ID of the trade to check
             user_id: ID of the authenticated user
             
         Returns:
-            Trade if found and belongs to user, None otherwise
+            True if the trade exists and belongs to the user
         """
-        query = select(Trade).where(
-            Trade.id == trade_id,
-            Trade.user_id == user_id
+        query = select(
+            exists().where(Trade.id == trade_id, Trade.user_id == user_id)
         )
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        return bool(await db.scalar(query))
     
     @staticmethod
     async def close_trade(
         db: AsyncSession,
-        trade: Trade,
+        trade_id: int,
+        user_id: int,
         exit_price: Decimal
-    ) -> Trade:
+    ) -> Optional[Trade]:
         """
         Close an open trade with the specified exit price.
         
@@ -163,24 +297,47 @@ class TradeService:
             Entry: $50,000, Exit: $45,000, Quantity: 0.1 BTC
             P&L = (50000 - 45000) * 0.1 = $500 profit
         
+        Implementation:
+        A single conditional UPDATE ... RETURNING both closes the trade
+        and checks that it is the user's and still OPEN. The P&L is
+        computed in the database (Trade.pnl_expression) and the updated
+        row comes back in the same round trip. Because the status check
+        is part of the UPDATE, two concurrent closes can't both succeed.
+        
         Args:
             db: Database session
-            trade: The trade to close (must be OPEN)
+            trade_id: ID of the trade to close
+            user_id: ID of the authenticated user
             exit_price: Price at which position is being closed
             
         Returns:
-            Updated trade with P&L calculated
+            Updated trade with P&L calculated, or None if no OPEN trade
+            with this ID belongs to the user
         """
-        # Calculate realized P&L using the model's method
-        trade.realized_pnl = trade.calculate_pnl(exit_price)
-        trade.exit_price = exit_price
-        trade.status = TradeStatus.CLOSED
-        trade.closed_at = datetime.utcnow()
+        stmt = (
+            update(Trade)
+            .where(
+                Trade.id == trade_id,
+                Trade.user_id == user_id,
+                Trade.status == TradeStatus.OPEN.value
+            )
+            .values(
+                exit_price=exit_price,
+                realized_pnl=Trade.pnl_expression(exit_price),
+                status=TradeStatus.CLOSED.value,
+                closed_at=utcnow()
+            )
+            .returning(Trade)
+        )
+        result = await db.execute(stmt)
+        closed_trade = result.scalar_one_or_none()
+        if closed_trade is None:
+            return None
         
         await db.commit()
-        await db.refresh(trade)
+        _summary_cache.pop(user_id, None)
         
-        return trade
+        return closed_trade
     
     @staticmethod
     async def get_portfolio_summary(
@@ -196,8 +353,12 @@ class TradeService:
         - Win/loss statistics
         
         Performance Considerations:
-        - Uses SQL aggregation for efficiency
-        - Single query for most metrics where possible
+        - One aggregate query: the database returns a single row of counts
+          and sums instead of every closed trade being shipped to Python
+        - FILTER (WHERE ...) clauses compute each metric in the same scan
+          of the user's rows (via the user_id-leading trade indexes)
+        - Results are cached per user until the next trade mutation
+          (see module docstring)
         
         Args:
             db: Database session
@@ -206,47 +367,49 @@ class TradeService:
         Returns:
             PortfolioSummary with calculated statistics
         """
-        # Count open positions
-        open_query = select(func.count(Trade.id)).where(
-            Trade.user_id == user_id,
-            Trade.status == TradeStatus.OPEN
-        )
-        open_result = await db.execute(open_query)
-        open_positions = open_result.scalar() or 0
+        cached = _summary_cache.get(user_id)
+        if cached is not None:
+            return cached
+        
+        is_open = Trade.status == TradeStatus.OPEN.value
+        is_closed = Trade.status == TradeStatus.CLOSED.value
+        closed_count = func.count().filter(is_closed)
+        winning_count = func.count().filter(is_closed, Trade.realized_pnl > 0)
         
-        # Get closed trades for P&L calculation
-        closed_query = select(Trade).where(
-            Trade.user_id == user_id,
-            Trade.status == TradeStatus.CLOSED
+        # Percentage of closed trades that were profitable, rounded to 2dp.
+        # The NUMERIC 100 keeps the division exact (not integer) and lets
+        # PostgreSQL's round(numeric, int) apply.
+        # NULLIF turns "no closed trades" into NULL instead of a division
+        # by zero, and COALESCE reports that as 0.
+        win_rate = func.coalesce(
+            func.round(
+                winning_count * literal(100, Numeric) / func.nullif(closed_count, 0),
+                2
+            ),
+            0
         )
-        closed_result = await db.execute(closed_query)
-        closed_trades = list(closed_result.scalars().all())
-        
-        # Calculate statistics from closed trades
-        total_pnl = Decimal("0")
-        winning_trades = 0
-        losing_trades = 0
-        
-        for trade in closed_trades:
-            if trade.realized_pnl:
-                total_pnl += trade.realized_pnl
-                if trade.realized_pnl > 0:
-                    winning_trades += 1
-                elif trade.realized_pnl < 0:
-                    losing_trades += 1
-        
-        closed_positions = len(closed_trades)
-        
-        # Calculate win rate (avoid division by zero)
-        win_rate = 0.0
-        if closed_positions > 0:
-            win_rate = (winning_trades / closed_positions) * 100
-        
-        return PortfolioSummary(
-            total_realized_pnl=total_pnl,
-            open_positions=open_positions,
-            closed_positions=closed_positions,
-            winning_trades=winning_trades,
-            losing_trades=losing_trades,
-            win_rate=round(win_rate, 2)
+        
+        query = select(
+            func.sum(Trade.realized_pnl).filter(is_closed).label("total_pnl"),
+            func.count().filter(is_open).label("open_positions"),
+            closed_count.label("closed_positions"),
+            winning_count.label("winning_trades"),
+            func.count().filter(is_closed, Trade.realized_pnl < 0).label("losing_trades"),
+            cast(win_rate, Float).label("win_rate"),
+        ).where(Trade.user_id == user_id)
+        
+        row = (await db.execute(query)).one()
+        
+        summary = PortfolioSummary(
+            # SUM over no closed trades is NULL
+            total_realized_pnl=(
+                row.total_pnl if row.total_pnl is not None else Decimal("0")
+            ),
+            open_positions=row.open_positions,
+            closed_positions=row.closed_positions,
+            winning_trades=row.winning_trades,
+            losing_trades=row.losing_trades,
+            win_rate=row.win_rate
         )
+        _summary_cache[user_id] = summary
+        return summary
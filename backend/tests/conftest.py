@@ -5,7 +5,9 @@ Shared test fixtures for the Crypto Trade Logger test suite.
 
 Test Strategy:
 - Use in-memory SQLite for fast, isolated tests
-- Each test gets a fresh database state
+- The schema is created once per test session; each test runs inside
+  a transaction that is rolled back afterwards, so every test still
+  starts from an empty database without paying for DDL
 - Async fixtures for testing async endpoints
 - Helper functions for common operations (create user, get token)
 
@@ -21,58 +23,99 @@ from typing import AsyncGenerator
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient, ASGITransport
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.pool import StaticPool
 
 # Override settings before importing app modules
 import os
 os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///:memory:"
-os.environ["JWT_SECRET_KEY"] = "test-secret-key"
+os.environ["JWT_SECRET_KEY"] = "test-secret-key-at-least-32-bytes"
+# Minimum bcrypt cost: hashing and login checks take ~1ms instead of
+# ~250ms, and still exercise real bcrypt hashes end to end
+os.environ["BCRYPT_COST"] = "4"
 
 from app.main import app
 from app.database import Base, get_db
+from app.dependencies import _user_cache
 from app.models.user import User
 from app.models.trade import Trade, TradeType, TradeStatus
 from app.services.auth_service import AuthService
+from app.services.trade_service import _summary_cache
 
 
 # Test database setup
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
+# An in-memory SQLite database lives and dies with its connection, so
+# every session must share a single one (StaticPool) to see the same data
 test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
+    poolclass=StaticPool,
     connect_args={"check_same_thread": False}
 )
 
-TestSessionLocal = async_sessionmaker(
-    bind=test_engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+
+# Let SQLAlchemy, not the sqlite3 driver, decide when transactions begin.
+# The driver's implicit BEGIN handling otherwise breaks the SAVEPOINTs
+# the per-test rollback below relies on.
+@event.listens_for(test_engine.sync_engine, "connect")
+def _disable_driver_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+@event.listens_for(test_engine.sync_engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
 
 
 # Configure pytest-asyncio mode
 pytest_plugins = ('pytest_asyncio',)
 
 
-@pytest_asyncio.fixture
-async def db_session() -> AsyncGenerator[AsyncSession, None]:
+@pytest_asyncio.fixture(scope="session")
+async def database() -> AsyncGenerator[None, None]:
     """
-    Provide a clean database session for each test.
-    
-    Creates all tables before the test and drops them after,
-    ensuring complete isolation between tests.
+    Create the schema once for the whole test session.
     """
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     
-    async with TestSessionLocal() as session:
+    yield
+    
+    await test_engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def db_session(database: None) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provide a clean database session for each test.
+    
+    The session is bound to a connection with an open transaction that
+    is rolled back after the test. Commits made by the test or the app
+    only release a SAVEPOINT inside it, so nothing outlives the test.
+    
+    The user and portfolio caches are cleared afterwards too: user IDs
+    repeat once the rows are rolled back, so entries would leak across
+    tests.
+    """
+    async with test_engine.connect() as conn:
+        await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        
         yield session
+        
+        await session.close()
+        await conn.rollback()
     
-    async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    _user_cache.clear()
+    _summary_cache.clear()
 
 
 @pytest_asyncio.fixture
@@ -98,7 +141,8 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
 async def create_test_user(
     db: AsyncSession,
     username: str,
-    password: str = "password123"
+    password: str = "password123",
+    commit: bool = True
 ) -> User:
     """
     Helper function to create a test user.
@@ -107,6 +151,8 @@ async def create_test_user(
         db: Database session
         username: Unique username
         password: Password (will be hashed)
+        commit: Commit right away; pass False to only flush (the user
+            gets its ID) and batch several rows into one commit
         
     Returns:
         Created User instance
@@ -116,6 +162,9 @@ async def create_test_user(
         hashed_password=AuthService.hash_password(password)
     )
     db.add(user)
+    if not commit:
+        await db.flush()
+        return user
     await db.commit()
     await db.refresh(user)
     return user
@@ -127,7 +176,8 @@ async def create_test_trade(
     symbol: str = "BTC/USDT",
     entry_price: Decimal = Decimal("50000"),
     quantity: Decimal = Decimal("0.1"),
-    trade_type: TradeType = TradeType.BUY
+    trade_type: TradeType = TradeType.BUY,
+    commit: bool = True
 ) -> Trade:
     """
     Helper function to create a test trade.
@@ -139,6 +189,8 @@ async def create_test_trade(
         entry_price: Entry price
         quantity: Trade amount
         trade_type: BUY or SELL
+        commit: Commit right away; pass False to only add the trade to
+            the session and batch several rows into one commit
         
     Returns:
         Created Trade instance
@@ -152,6 +204,8 @@ async def create_test_trade(
         status=TradeStatus.OPEN
     )
     db.add(trade)
+    if not commit:
+        return trade
     await db.commit()
     await db.refresh(trade)
     return trade
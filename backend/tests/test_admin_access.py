@@ -0,0 +1,112 @@
+"""
+Admin Access Tests
+==================
+Tests verifying that admin endpoints are gated on the token's claims.
+
+Admin routes authorize from the is_admin claim set at login, without
+loading the user from the database. These tests pin down that:
+- Regular users are rejected with 403
+- Admins can see every user's trades, streamed as NDJSON pages
+- Requests without a valid token are rejected with 401
+"""
+
+import json
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.conftest import (
+    create_test_user,
+    create_test_trade,
+    get_auth_token
+)
+
+
+@pytest.mark.asyncio
+async def test_non_admin_cannot_list_all_trades(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """A regular user's token must not grant access to admin endpoints."""
+    await create_test_user(db_session, "trader_alice")
+    token = await get_auth_token(client, "trader_alice", "password123")
+
+    response = await client.get(
+        "/api/v1/admin/trades",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_admin_sees_trades_from_all_users(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """An admin token lists trades regardless of owner."""
+    admin = await create_test_user(db_session, "admin_carol")
+    admin.is_admin = True
+    await db_session.commit()
+
+    user_a = await create_test_user(db_session, "trader_alice")
+    user_b = await create_test_user(db_session, "trader_bob")
+    await create_test_trade(db_session, user_id=user_a.id)
+    await create_test_trade(db_session, user_id=user_b.id, symbol="ETH/USDT")
+
+    token = await get_auth_token(client, "admin_carol", "password123")
+
+    response = await client.get(
+        "/api/v1/admin/trades",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    symbols = sorted(trade["symbol"] for trade in _read_ndjson(response.text))
+    assert symbols == ["BTC/USDT", "ETH/USDT"]
+
+
+@pytest.mark.asyncio
+async def test_admin_trades_keyset_pagination(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """Pages follow after_id newest first, without gaps or repeats."""
+    admin = await create_test_user(db_session, "admin_carol")
+    admin.is_admin = True
+    await db_session.commit()
+
+    user = await create_test_user(db_session, "trader_alice")
+    created = [
+        (await create_test_trade(db_session, user_id=user.id)).id
+        for _ in range(5)
+    ]
+
+    token = await get_auth_token(client, "admin_carol", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = await client.get("/api/v1/admin/trades?limit=3", headers=headers)
+    first_ids = [trade["id"] for trade in _read_ndjson(first.text)]
+    second = await client.get(
+        f"/api/v1/admin/trades?limit=3&after_id={first_ids[-1]}",
+        headers=headers
+    )
+    second_ids = [trade["id"] for trade in _read_ndjson(second.text)]
+
+    assert first_ids + second_ids == sorted(created, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_admin_endpoint_rejects_invalid_token(client: AsyncClient):
+    """A malformed token is a 401, not a 403."""
+    response = await client.get(
+        "/api/v1/admin/trades",
+        headers={"Authorization": "Bearer not-a-jwt"}
+    )
+
+    assert response.status_code == 401
+
+
+def _read_ndjson(body: str) -> list[dict]:
+    """Parse a newline-delimited JSON response body."""
+    return [json.loads(line) for line in body.splitlines() if line]
@@ -0,0 +1,143 @@
+"""
+Authentication Tests
+====================
+Tests for registration and login behaviour not covered by the access tests.
+
+Username uniqueness is enforced by the INSERT itself, so a taken
+username must come back as a 409 rather than an integrity error. Taken
+usernames are also caught before hashing, so they cost no bcrypt work.
+
+Password hashes made with a different bcrypt cost than BCRYPT_COST
+are upgraded transparently on the next successful login, so the cost
+can be tuned without invalidating existing accounts.
+"""
+
+import bcrypt
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import false, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.user import User
+from app.routers import auth as auth_router
+from app.services.auth_service import AuthService
+from tests.conftest import create_test_user
+
+
+@pytest.mark.asyncio
+async def test_login_upgrades_hash_with_outdated_cost(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """A hash at another cost still logs in and is re-hashed at the current one."""
+    legacy_hash = bcrypt.hashpw(b"password123", bcrypt.gensalt(rounds=5)).decode()
+    user = User(username="trader_alice", hashed_password=legacy_hash)
+    db_session.add(user)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "trader_alice", "password": "password123"}
+    )
+
+    assert response.status_code == 200
+    await db_session.refresh(user)
+    assert user.hashed_password != legacy_hash
+    assert not AuthService.needs_rehash(user.hashed_password)
+    assert AuthService.verify_password("password123", user.hashed_password)
+
+
+@pytest.mark.asyncio
+async def test_register_rejects_taken_username(client: AsyncClient):
+    """The second registration of a username is a 409, not a server error."""
+    payload = {"username": "trader_alice", "password": "password123"}
+
+    first = await client.post("/api/v1/auth/register", json=payload)
+    second = await client.post("/api/v1/auth/register", json=payload)
+
+    assert first.status_code == 201
+    assert first.json()["username"] == "trader_alice"
+    assert second.status_code == 409
+    assert second.json()["error"]["code"] == "USERNAME_EXISTS"
+
+
+@pytest.mark.asyncio
+async def test_usernames_are_unique_regardless_of_case(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """A mixed-case account blocks the lowercase name and logs in by either."""
+    db_session.add(User(
+        username="Trader_Alice",
+        hashed_password=AuthService.hash_password("password123")
+    ))
+    await db_session.commit()
+
+    register = await client.post(
+        "/api/v1/auth/register",
+        json={"username": "trader_alice", "password": "password123"}
+    )
+    login = await client.post(
+        "/api/v1/auth/login",
+        data={"username": "TRADER_ALICE", "password": "password123"}
+    )
+
+    assert register.status_code == 409
+    assert login.status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("username", ["___", "---", "_-_"])
+async def test_register_rejects_separator_only_username(
+    client: AsyncClient,
+    username: str
+):
+    """A username needs at least one letter or digit, not just _ and -."""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"username": username, "password": "password123"}
+    )
+
+    assert response.status_code == 422
+    assert response.json()["error"]["code"] == "VALIDATION_ERROR"
+
+
+@pytest.mark.asyncio
+async def test_register_taken_username_skips_password_hashing(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """A taken username is rejected before any bcrypt work is done."""
+    await create_test_user(db_session, "trader_alice")
+
+    async def fail_hash(password: str) -> str:
+        raise AssertionError("password was hashed for a taken username")
+
+    monkeypatch.setattr(AuthService, "hash_password_async", fail_hash)
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"username": "Trader_Alice", "password": "password123"}
+    )
+
+    assert response.status_code == 409
+    assert response.json()["error"]["code"] == "USERNAME_EXISTS"
+
+
+@pytest.mark.asyncio
+async def test_register_race_past_probe_is_still_a_conflict(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """If the pre-hash probe misses a taken name, the INSERT still rejects it."""
+    await create_test_user(db_session, "trader_alice")
+
+    # Simulate a concurrent registration committing after the probe ran
+    monkeypatch.setattr(auth_router, "_USERNAME_TAKEN", select(false()))
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={"username": "trader_alice", "password": "password123"}
+    )
+
+    assert response.status_code == 409
+    assert response.json()["error"]["code"] == "USERNAME_EXISTS"
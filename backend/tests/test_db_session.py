@@ -0,0 +1,94 @@
+"""
+Database Session Lifecycle Tests
+================================
+Tests for the real get_db dependency and DBSessionMiddleware.
+
+The client fixture overrides get_db, so these tests build their own
+client without the override. AsyncSessionLocal is swapped for a factory
+that records every session it hands out, bound to the test transaction
+so nothing is written outside the test.
+"""
+
+from typing import AsyncGenerator, List
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.conftest import create_test_user
+from app import database
+from app.main import app
+from app.services.auth_service import AuthService
+
+
+class RecordingSession(AsyncSession):
+    """AsyncSession that remembers whether it has been closed."""
+
+    closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+        await super().close()
+
+
+@pytest_asyncio.fixture
+async def sessions(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch
+) -> List[RecordingSession]:
+    """Make get_db create recording sessions, and collect them."""
+    created: List[RecordingSession] = []
+
+    def session_factory() -> RecordingSession:
+        session = RecordingSession(
+            bind=db_session.bind,
+            expire_on_commit=False,
+            autoflush=False,
+            join_transaction_mode="create_savepoint",
+        )
+        created.append(session)
+        return session
+
+    monkeypatch.setattr(database, "AsyncSessionLocal", session_factory)
+    return created
+
+
+@pytest_asyncio.fixture
+async def raw_client() -> AsyncGenerator[AsyncClient, None]:
+    """Test client that uses the app's own get_db."""
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_request_gets_one_session_closed_after_response(
+    raw_client: AsyncClient,
+    db_session: AsyncSession,
+    sessions: List[RecordingSession]
+):
+    """get_current_user and the route share one session, closed afterwards."""
+    user = await create_test_user(db_session, "trader_alice")
+    token = AuthService.create_access_token(
+        {"sub": str(user.id), "username": user.username, "is_admin": False}
+    )
+
+    response = await raw_client.get(
+        "/api/v1/trades",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    assert len(sessions) == 1
+    assert sessions[0].closed
+
+
+@pytest.mark.asyncio
+async def test_request_without_db_dependency_opens_no_session(
+    raw_client: AsyncClient,
+    sessions: List[RecordingSession]
+):
+    """Routes that never depend on get_db don't create a session."""
+    response = await raw_client.get("/")
+
+    assert response.status_code == 200
+    assert sessions == []
@@ -0,0 +1,151 @@
+"""
+Portfolio Summary Tests
+=======================
+Tests for the portfolio analytics endpoint.
+
+The summary is aggregated by the database in a single query, so these
+tests pin each metric against a small known set of trades. Summaries
+are also cached per user, so trade changes must evict the cached copy.
+"""
+
+from decimal import Decimal
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.conftest import (
+    create_test_user,
+    create_test_trade,
+    get_auth_token
+)
+from app.models.trade import TradeType
+from app.schemas.trade import TradeCreate
+from app.services.trade_service import TradeService
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary_aggregates_closed_and_open_trades(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """One win, one loss and one open trade produce the expected metrics."""
+    user = await create_test_user(db_session, "trader_alice")
+    winner = await create_test_trade(db_session, user_id=user.id)
+    loser = await create_test_trade(db_session, user_id=user.id)
+    await create_test_trade(db_session, user_id=user.id)
+    token = await get_auth_token(client, "trader_alice", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    await client.patch(
+        f"/api/v1/trades/{winner.id}/close",
+        json={"exit_price": "55000"},
+        headers=headers
+    )
+    await client.patch(
+        f"/api/v1/trades/{loser.id}/close",
+        json={"exit_price": "48000"},
+        headers=headers
+    )
+
+    response = await client.get("/api/v1/portfolio/summary", headers=headers)
+
+    assert response.status_code == 200
+    summary = response.json()
+    assert Decimal(summary["total_realized_pnl"]) == Decimal("300")
+    assert summary["open_positions"] == 1
+    assert summary["closed_positions"] == 2
+    assert summary["winning_trades"] == 1
+    assert summary["losing_trades"] == 1
+    assert summary["win_rate"] == 50.0
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary_for_user_without_trades(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """A new account gets an all-zero summary rather than nulls."""
+    await create_test_user(db_session, "trader_alice")
+    token = await get_auth_token(client, "trader_alice", "password123")
+
+    response = await client.get(
+        "/api/v1/portfolio/summary",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "total_realized_pnl": "0",
+        "open_positions": 0,
+        "closed_positions": 0,
+        "winning_trades": 0,
+        "losing_trades": 0,
+        "win_rate": 0.0
+    }
+
+
+@pytest.mark.asyncio
+async def test_portfolio_summary_reflects_trade_changes_immediately(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """Opening or closing a trade invalidates the cached summary."""
+    await create_test_user(db_session, "trader_alice")
+    token = await get_auth_token(client, "trader_alice", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    before = await client.get("/api/v1/portfolio/summary", headers=headers)
+    created = await client.post(
+        "/api/v1/trades",
+        json={
+            "symbol": "BTC/USDT",
+            "entry_price": "50000",
+            "quantity": "0.1",
+            "trade_type": "BUY"
+        },
+        headers=headers
+    )
+    after_open = await client.get("/api/v1/portfolio/summary", headers=headers)
+    await client.patch(
+        f"/api/v1/trades/{created.json()['id']}/close",
+        json={"exit_price": "51000"},
+        headers=headers
+    )
+    after_close = await client.get("/api/v1/portfolio/summary", headers=headers)
+
+    assert before.json()["open_positions"] == 0
+    assert after_open.json()["open_positions"] == 1
+    assert after_close.json()["open_positions"] == 0
+    assert Decimal(after_close.json()["total_realized_pnl"]) == Decimal("100")
+
+
+@pytest.mark.asyncio
+async def test_summary_cached_during_trade_creation_is_not_double_counted(
+    db_session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch
+):
+    """A summary read between the commit and the cache update stays correct."""
+    user = await create_test_user(db_session, "trader_alice")
+    commit = db_session.commit
+    
+    async def commit_then_read_summary():
+        # Another request reads (and caches) the summary right after the
+        # INSERT commits, before create_trade updates the cache
+        await commit()
+        await TradeService.get_portfolio_summary(db_session, user.id)
+    
+    monkeypatch.setattr(db_session, "commit", commit_then_read_summary)
+    await TradeService.create_trade(
+        db_session,
+        user.id,
+        TradeCreate(
+            symbol="BTC/USDT",
+            entry_price=Decimal("50000"),
+            quantity=Decimal("0.1"),
+            trade_type=TradeType.BUY
+        )
+    )
+    monkeypatch.undo()
+    
+    summary = await TradeService.get_portfolio_summary(db_session, user.id)
+    
+    assert summary.open_positions == 1
@@ -68,12 +68,12 @@ async def test_user_cannot_see_other_users_trades(
     
     # User A fetches their trades
     response = await client.get(
-        "/trades",
+        "/api/v1/trades",
         headers={"Authorization": f"Bearer {token_a}"}
     )
     
     assert response.status_code == 200
-    trades = response.json()
+    trades = response.json()["items"]
     
     # Verify User A only sees their own trade
     assert len(trades) == 1
@@ -121,7 +121,7 @@ async def test_user_cannot_close_other_users_trade(
     
     # User A attempts to close User B's trade
     response = await client.patch(
-        f"/trades/{trade_b.id}/close",
+        f"/api/v1/trades/{trade_b.id}/close",
         json={"exit_price": "3500"},
         headers={"Authorization": f"Bearer {token_a}"}
     )
@@ -152,8 +152,9 @@ async def test_portfolio_summary_only_includes_own_trades(
     This ensures financial data isolation in analytics.
     """
     # Setup: Create two users
-    user_a = await create_test_user(db_session, "trader_alice")
-    user_b = await create_test_user(db_session, "trader_bob")
+    # Rows are only flushed here and committed together below
+    user_a = await create_test_user(db_session, "trader_alice", commit=False)
+    user_b = await create_test_user(db_session, "trader_bob", commit=False)
     
     # Create a closed trade for User A with $500 profit
     trade_a = await create_test_trade(
@@ -162,12 +163,12 @@ async def test_portfolio_summary_only_includes_own_trades(
         symbol="BTC/USDT",
         entry_price=Decimal("50000"),
         quantity=Decimal("0.1"),
-        trade_type=TradeType.BUY
+        trade_type=TradeType.BUY,
+        commit=False
     )
     trade_a.status = TradeStatus.CLOSED
     trade_a.exit_price = Decimal("55000")
     trade_a.realized_pnl = Decimal("500")  # (55000 - 50000) * 0.1
-    await db_session.commit()
     
     # Create a closed trade for User B with $1000 profit
     trade_b = await create_test_trade(
@@ -176,11 +177,14 @@ async def test_portfolio_summary_only_includes_own_trades(
         symbol="ETH/USDT",
         entry_price=Decimal("3000"),
         quantity=Decimal("1.0"),
-        trade_type=TradeType.BUY
+        trade_type=TradeType.BUY,
+        commit=False
     )
     trade_b.status = TradeStatus.CLOSED
     trade_b.exit_price = Decimal("4000")
     trade_b.realized_pnl = Decimal("1000")  # (4000 - 3000) * 1.0
+    
+    # One commit inserts both trades already closed (no follow-up UPDATE)
     await db_session.commit()
     
     # Get auth token for User A
@@ -188,7 +192,7 @@ async def test_portfolio_summary_only_includes_own_trades(
     
     # User A fetches portfolio summary
     response = await client.get(
-        "/portfolio/summary",
+        "/api/v1/portfolio/summary",
         headers={"Authorization": f"Bearer {token_a}"}
     )
     
@@ -0,0 +1,113 @@
+"""
+Trade Lifecycle Tests
+=====================
+Tests for opening and closing positions through the API.
+
+Realized P&L is computed by the database when a trade is closed,
+so these tests pin the results for both trade directions:
+- BUY (Long): (exit_price - entry_price) * quantity
+- SELL (Short): (entry_price - exit_price) * quantity
+
+Trade.calculate_pnl, the Python copy of the formula, is checked
+against the same cases so the two can't drift apart.
+"""
+
+from decimal import Decimal
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.conftest import (
+    create_test_user,
+    create_test_trade,
+    get_auth_token
+)
+from app.models.trade import Trade, TradeType
+
+
+# Profit and loss for both directions, entering at 50000 with 0.1 units
+PNL_CASES = [
+    (TradeType.BUY, "55000", Decimal("500")),
+    (TradeType.BUY, "45000", Decimal("-500")),
+    (TradeType.SELL, "45000", Decimal("500")),
+    (TradeType.SELL, "55000", Decimal("-500")),
+]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("trade_type, exit_price, expected_pnl", PNL_CASES)
+async def test_close_trade_calculates_realized_pnl(
+    client: AsyncClient,
+    db_session: AsyncSession,
+    trade_type: TradeType,
+    exit_price: str,
+    expected_pnl: Decimal
+):
+    """Closing a trade records the exit and the direction-aware P&L."""
+    user = await create_test_user(db_session, "trader_alice")
+    trade = await create_test_trade(
+        db_session,
+        user_id=user.id,
+        entry_price=Decimal("50000"),
+        quantity=Decimal("0.1"),
+        trade_type=trade_type
+    )
+    token = await get_auth_token(client, "trader_alice", "password123")
+
+    response = await client.patch(
+        f"/api/v1/trades/{trade.id}/close",
+        json={"exit_price": exit_price},
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "CLOSED"
+    assert Decimal(body["exit_price"]) == Decimal(exit_price)
+    assert Decimal(body["realized_pnl"]) == expected_pnl
+    assert body["closed_at"] is not None
+
+
+@pytest.mark.asyncio
+async def test_close_trade_twice_is_rejected(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """A closed trade cannot be closed again; the first exit is kept."""
+    user = await create_test_user(db_session, "trader_alice")
+    trade = await create_test_trade(db_session, user_id=user.id)
+    token = await get_auth_token(client, "trader_alice", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = await client.patch(
+        f"/api/v1/trades/{trade.id}/close",
+        json={"exit_price": "55000"},
+        headers=headers
+    )
+    second = await client.patch(
+        f"/api/v1/trades/{trade.id}/close",
+        json={"exit_price": "60000"},
+        headers=headers
+    )
+
+    assert first.status_code == 200
+    assert second.status_code == 400
+    assert second.json()["error"]["code"] == "TRADE_ALREADY_CLOSED"
+
+    await db_session.refresh(trade)
+    assert trade.exit_price == Decimal("55000")
+
+
+@pytest.mark.parametrize("trade_type, exit_price, expected_pnl", PNL_CASES)
+def test_calculate_pnl_matches_database_pnl(
+    trade_type: TradeType,
+    exit_price: str,
+    expected_pnl: Decimal
+):
+    """The Python formula agrees with the P&L the database computes on close."""
+    trade = Trade(
+        entry_price=Decimal("50000"),
+        quantity=Decimal("0.1"),
+        trade_type=trade_type.value
+    )
+
+    assert trade.calculate_pnl(Decimal(exit_price)) == expected_pnl
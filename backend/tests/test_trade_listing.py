@@ -0,0 +1,69 @@
+"""
+Trade Listing Tests
+===================
+Tests for cursor pagination of GET /trades.
+
+Trades are listed newest first by (created_at, id). Several trades can
+share a created_at timestamp, so these tests create trades back to back
+and check that walking the cursor returns every trade exactly once.
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from tests.conftest import (
+    create_test_user,
+    create_test_trade,
+    get_auth_token
+)
+
+
+@pytest.mark.asyncio
+async def test_trades_are_paginated_by_cursor(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """Following next_cursor visits every trade once, newest first."""
+    user = await create_test_user(db_session, "trader_alice")
+    created = [
+        (await create_test_trade(db_session, user_id=user.id)).id
+        for _ in range(5)
+    ]
+    token = await get_auth_token(client, "trader_alice", "password123")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = await client.get("/api/v1/trades", params=params, headers=headers)
+        assert response.status_code == 200
+        page = response.json()
+        assert len(page["items"]) <= 2
+        seen.extend(trade["id"] for trade in page["items"])
+        if page["next_cursor"] is None:
+            break
+        params = {"limit": 2, "after": page["next_cursor"]}
+
+    assert seen == sorted(created, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_cursor_from_another_user_returns_nothing(
+    client: AsyncClient,
+    db_session: AsyncSession
+):
+    """A cursor only resolves against the caller's own trades."""
+    user_a = await create_test_user(db_session, "trader_alice")
+    user_b = await create_test_user(db_session, "trader_bob")
+    await create_test_trade(db_session, user_id=user_a.id)
+    trade_b = await create_test_trade(db_session, user_id=user_b.id)
+    token_a = await get_auth_token(client, "trader_alice", "password123")
+
+    response = await client.get(
+        "/api/v1/trades",
+        params={"after": trade_b.id},
+        headers={"Authorization": f"Bearer {token_a}"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": None}
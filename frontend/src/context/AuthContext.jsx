@@ -47,7 +47,7 @@ export function AuthProvider({ children }) {
             const payload = decodeJwtPayload(storedToken);
             if (payload) {
                 setUser({
-                    username: payload.sub,
+                    username: payload.username,
                     isAdmin: payload.is_admin || false,
                     authenticated: true
                 });
@@ -20,6 +20,8 @@ import PortfolioSummary from '../components/PortfolioSummary';
 
 export default function Dashboard() {
     const [trades, setTrades] = useState([]);
+    const [nextCursor, setNextCursor] = useState(null);
+    const [loadingMore, setLoadingMore] = useState(false);
     const [summary, setSummary] = useState(null);
     const [loading, setLoading] = useState(true);
     const [error, setError] = useState(null);
@@ -37,7 +39,8 @@ export default function Dashboard() {
                 tradesAPI.getAll(),
                 portfolioAPI.getSummary(),
             ]);
-            setTrades(tradesRes.data);
+            setTrades(tradesRes.data.items);
+            setNextCursor(tradesRes.data.next_cursor);
             setSummary(summaryRes.data);
         } catch (err) {
             console.error('Failed to fetch data:', err);
@@ -51,6 +54,21 @@ export default function Dashboard() {
         fetchData();
     }, [fetchData]);
 
+    // Fetch the next page of older trades
+    const loadMoreTrades = async () => {
+        setLoadingMore(true);
+        try {
+            const response = await tradesAPI.getAll({ after: nextCursor });
+            setTrades((prev) => [...prev, ...response.data.items]);
+            setNextCursor(response.data.next_cursor);
+        } catch (err) {
+            console.error('Failed to load more trades:', err);
+            setError('Failed to load more trades. Please try again.');
+        } finally {
+            setLoadingMore(false);
+        }
+    };
+
     // Handle adding a new trade
     const handleTradeAdded = (newTrade) => {
         setTrades((prev) => [newTrade, ...prev]);
@@ -188,6 +206,18 @@ export default function Dashboard() {
                     </div>
 
                     <TradeTable trades={trades} onCloseTrade={handleCloseTrade} />
+
+                    {nextCursor && (
+                        <div className="flex justify-center mt-4">
+                            <button
+                                onClick={loadMoreTrades}
+                                disabled={loadingMore}
+                                className="btn-primary"
+                            >
+                                {loadingMore ? 'Loading...' : 'Load older trades'}
+                            </button>
+                        </div>
+                    )}
                 </div>
             </main>
 
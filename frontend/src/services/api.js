@@ -62,9 +62,15 @@ export const authAPI = {
         api.post('/api/v1/auth/register', { username, password }),
 };
 
+// getAll returns one page: { items, next_cursor }; pass next_cursor as `after`
 export const tradesAPI = {
-    getAll: (status = null) =>
-        api.get('/api/v1/trades', { params: status ? { status } : {} }),
+    getAll: ({ status = null, after = null } = {}) =>
+        api.get('/api/v1/trades', {
+            params: {
+                ...(status ? { status } : {}),
+                ...(after ? { after } : {}),
+            },
+        }),
     create: (tradeData) => api.post('/api/v1/trades', tradeData),
     close: (tradeId, exitPrice) =>
         api.patch(`/api/v1/trades/${tradeId}/close`, { exit_price: exitPrice }),
@@ -75,8 +81,15 @@ export const portfolioAPI = {
 };
 
 // Admin API - Requires admin privileges
+// Trades are streamed as NDJSON pages; pass the last id as afterId for the next page
 export const adminAPI = {
-    getAllTrades: () => api.get('/api/v1/admin/trades'),
+    getAllTrades: async ({ limit = 100, afterId } = {}) => {
+        const response = await api.get('/api/v1/admin/trades', {
+            params: { limit, after_id: afterId },
+            responseType: 'text',
+        });
+        return response.data.split('\n').filter(Boolean).map((line) => JSON.parse(line));
+    },
 };
 
 export default api;